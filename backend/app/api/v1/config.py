@@ -8,18 +8,22 @@ This module provides endpoints for importing and exporting all system configurat
 import logging
 from typing import Any, Dict
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
 from app.models.user import User
 from app.services.mcp_config_manager import MCPConfigManager
-from app.services.model_config_manager import ModelConfigManager
+from app.services.model_config_manager import REQUIRED_IMPORT_FIELDS, ModelConfigManager
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# Responses are encoded with orjson rather than the stdlib json module
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class UnifiedConfigExportResponse(BaseModel):
@@ -40,12 +44,40 @@ class UnifiedConfigImportRequest(BaseModel):
     )
 
 
+# Request bodies are decoded and validated straight from the raw JSON bytes in
+# one pass, rather than parsed into Python objects first and validated after
+_CONFIG_DATA_ADAPTER = TypeAdapter(Dict[str, Any])
+
+
+async def _read_json_body(request: Request, validate_json) -> Any:
+    """
+    Decode and validate a JSON request body in a single pass.
+
+    Args:
+        request: Incoming request
+        validate_json: Pydantic JSON validator for the expected body
+
+    Returns:
+        Validated request body
+
+    Raises:
+        RequestValidationError: If the body is not valid JSON of the expected shape
+    """
+    try:
+        return validate_json(await request.body())
+    except PydanticValidationError as e:
+        # Report errors against the body, as FastAPI does for declared bodies
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+
+
 @router.get("/export", response_model=UnifiedConfigExportResponse)
 async def export_all_configurations(
     include_api_keys: bool = False,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> UnifiedConfigExportResponse:
+) -> Dict[str, Any]:
     """
     Export all system configurations (models, MCP servers, skills).
 
@@ -84,7 +116,7 @@ async def export_all_configurations(
             f"and {len(mcp_data.get('servers', []))} MCP servers"
         )
 
-        return UnifiedConfigExportResponse(**unified_export)
+        return unified_export
 
     except Exception as e:
         logger.error(f"Failed to export configurations: {str(e)}")
@@ -94,9 +126,21 @@ async def export_all_configurations(
         )
 
 
-@router.post("/import")
+@router.post(
+    "/import",
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {
+                    "schema": UnifiedConfigImportRequest.model_json_schema()
+                }
+            },
+            "required": True,
+        }
+    },
+)
 async def import_all_configurations(
-    import_request: UnifiedConfigImportRequest,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> Dict[str, Any]:
@@ -104,7 +148,7 @@ async def import_all_configurations(
     Import all system configurations (models, MCP servers, skills).
 
     Args:
-        import_request: Import request with unified configuration data
+        request: Request whose body holds the unified configuration data
         db: Database session
         current_user: Current user
 
@@ -115,6 +159,10 @@ async def import_all_configurations(
         Configurations with existing names/labels will be skipped unless
         overwrite=True in the request.
     """
+    import_request = await _read_json_body(
+        request, UnifiedConfigImportRequest.model_validate_json
+    )
+
     try:
         results = {
             "models_imported": 0,
@@ -173,16 +221,26 @@ async def import_all_configurations(
         )
 
 
-@router.post("/validate")
+@router.post(
+    "/validate",
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": _CONFIG_DATA_ADAPTER.json_schema()}
+            },
+            "required": True,
+        }
+    },
+)
 async def validate_configuration(
-    config_data: Dict[str, Any],
+    request: Request,
     current_user: User = Depends(get_current_user),
 ) -> Dict[str, Any]:
     """
     Validate configuration data before import.
 
     Args:
-        config_data: Configuration data to validate
+        request: Request whose body holds the configuration data to validate
         current_user: Current user
 
     Returns:
@@ -192,6 +250,8 @@ async def validate_configuration(
         This endpoint validates the structure and content of configuration
         data without actually importing it. Useful for previewing imports.
     """
+    config_data = await _read_json_body(request, _CONFIG_DATA_ADAPTER.validate_json)
+
     try:
         validation_results = {
             "valid": True,
@@ -219,8 +279,7 @@ async def validate_configuration(
 
                 # Check required fields
                 for idx, model in enumerate(models_data["models"]):
-                    required_fields = ["provider", "label", "model_name"]
-                    missing_fields = [f for f in required_fields if f not in model]
+                    missing_fields = [f for f in REQUIRED_IMPORT_FIELDS if f not in model]
                     if missing_fields:
                         validation_results["errors"].append(
                             f"Model #{idx + 1} missing required fields: {missing_fields}"
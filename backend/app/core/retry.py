@@ -3,7 +3,7 @@ import asyncio
 import logging
 import time
 from functools import wraps
-from typing import Any, Callable, Optional, Type, TypeVar, Union
+from typing import Any, Awaitable, Callable, Optional, Type, TypeVar, Union
 
 from app.core.exceptions import (
     DatabaseError,
@@ -74,6 +74,7 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         recovery_timeout: float = 60.0,
         expected_exception: Type[Exception] = Exception,
+        clock: Callable[[], float] = time.monotonic,
     ):
         """Initialize circuit breaker.
 
@@ -81,10 +82,12 @@ class CircuitBreaker:
             failure_threshold: Number of failures before opening circuit
             recovery_timeout: Time in seconds before attempting recovery
             expected_exception: Exception type to track
+            clock: Monotonic time source in seconds
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.expected_exception = expected_exception
+        self._clock = clock
         self.failure_count = 0
         self.last_failure_time: Optional[float] = None
         self.state = "closed"  # closed, open, half_open
@@ -104,7 +107,7 @@ class CircuitBreaker:
             Exception: If circuit is open
         """
         if self.state == "open":
-            if time.time() - self.last_failure_time >= self.recovery_timeout:
+            if self._clock() - self.last_failure_time >= self.recovery_timeout:
                 self.state = "half_open"
                 logger.info("Circuit breaker entering half-open state")
             else:
@@ -119,7 +122,7 @@ class CircuitBreaker:
             return result
         except self.expected_exception as e:
             self.failure_count += 1
-            self.last_failure_time = time.time()
+            self.last_failure_time = self._clock()
 
             if self.failure_count >= self.failure_threshold:
                 self.state = "open"
@@ -140,6 +143,7 @@ async def retry_async(
         MCPConnectionError,
     ),
     strategy: Optional[RetryStrategy] = None,
+    sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
     **kwargs: Any,
 ) -> T:
     """Retry an async function with exponential backoff.
@@ -150,6 +154,7 @@ async def retry_async(
         max_retries: Maximum number of retries
         retry_on: Tuple of exception types to retry on
         strategy: Retry strategy to use
+        sleep: Coroutine function used to wait between attempts
         **kwargs: Keyword arguments
 
     Returns:
@@ -177,7 +182,7 @@ async def retry_async(
                     f"Attempt {attempt + 1}/{max_retries + 1} failed: {str(e)}. "
                     f"Retrying in {delay:.2f}s..."
                 )
-                await asyncio.sleep(delay)
+                await sleep(delay)
             else:
                 logger.error(f"All {max_retries + 1} attempts failed")
         except Exception as e:
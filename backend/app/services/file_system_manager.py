@@ -4,7 +4,7 @@ import hashlib
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import aiofiles
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -44,7 +44,7 @@ class FileSystemManager:
     async def write_file(
         self,
         path: str,
-        content: str,
+        content: Union[str, bytes],
         category: str = "draft",
         agent_id: Optional[str] = None,
     ) -> ContextFile:
@@ -53,7 +53,7 @@ class FileSystemManager:
 
         Args:
             path: Relative path to the file
-            content: File content
+            content: File content, as text or UTF-8 encoded bytes
             category: File category (draft, reference, upload, memory, todo, system)
             agent_id: ID of the agent creating the file
 
@@ -71,12 +71,15 @@ class FileSystemManager:
         full_path = self.workspace_dir / path
         full_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Encode once; the file, checksum and version snapshot all use the bytes
+        data = content.encode("utf-8") if isinstance(content, str) else content
+
         # Write content
-        async with aiofiles.open(full_path, "w", encoding="utf-8") as f:
-            await f.write(content)
+        async with aiofiles.open(full_path, "wb") as f:
+            await f.write(data)
 
         # Calculate checksum
-        checksum = self._calculate_checksum(content)
+        checksum = self._calculate_checksum(data)
 
         # Get file info
         file_stat = full_path.stat()
@@ -93,7 +96,7 @@ class FileSystemManager:
             # Create new version
             await self._create_version(
                 file_id=str(existing_file.id),
-                content=content,
+                content=data,
                 agent_id=agent_id or "system",
             )
 
@@ -119,7 +122,7 @@ class FileSystemManager:
             # Create initial version
             await self._create_version(
                 file_id=str(file_record.id),
-                content=content,
+                content=data,
                 agent_id=agent_id or "system",
             )
 
@@ -141,22 +144,33 @@ class FileSystemManager:
             FileNotFoundError: If file doesn't exist
             PermissionDeniedError: If access denied
         """
-        # Validate path
-        if not self._is_valid_path(path):
-            raise PermissionDeniedError(f"Invalid path: {path}")
-
-        # Create full path
-        full_path = self.workspace_dir / path
-
-        if not full_path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
+        full_path = self._existing_file_path(path)
 
-        # Read content
-        async with aiofiles.open(full_path, "r", encoding="utf-8") as f:
+        # Read content; newline="" keeps line endings exactly as written
+        async with aiofiles.open(full_path, "r", encoding="utf-8", newline="") as f:
             content = await f.read()
 
         return content
 
+    async def read_bytes(self, path: str) -> bytes:
+        """
+        Read raw content from a file without decoding it.
+
+        Args:
+            path: Relative path to the file
+
+        Returns:
+            File content as bytes
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            PermissionDeniedError: If access denied
+        """
+        full_path = self._existing_file_path(path)
+
+        async with aiofiles.open(full_path, "rb") as f:
+            return await f.read()
+
     async def edit_file(
         self,
         path: str,
@@ -288,7 +302,7 @@ class FileSystemManager:
 
         return file_record.versions
 
-    async def should_externalize_content(self, content: str) -> bool:
+    def should_externalize_content(self, content: str) -> bool:
         """
         Check if content should be externalized to a file.
 
@@ -298,7 +312,20 @@ class FileSystemManager:
         Returns:
             True if content exceeds threshold, False otherwise
         """
-        return len(content) > self.CONTEXT_THRESHOLD
+        return self.should_externalize_size(len(content))
+
+    @classmethod
+    def should_externalize_size(cls, size: int) -> bool:
+        """
+        Check if content of a given length should be externalized to a file.
+
+        Args:
+            size: Content length in characters
+
+        Returns:
+            True if size exceeds threshold, False otherwise
+        """
+        return size > cls.CONTEXT_THRESHOLD
 
     async def _get_file_by_path(self, path: str) -> Optional[ContextFile]:
         """Get file record by path."""
@@ -311,13 +338,13 @@ class FileSystemManager:
         )
         return result.scalar_one_or_none()
 
-    async def _create_version(self, file_id: str, content: str, agent_id: str) -> FileVersion:
+    async def _create_version(self, file_id: str, content: bytes, agent_id: str) -> FileVersion:
         """Create a new file version."""
         # Create snapshot file
         snapshot_path = self.workspace_dir / ".versions" / f"{file_id}_{datetime.utcnow().timestamp()}.txt"
         snapshot_path.parent.mkdir(parents=True, exist_ok=True)
 
-        async with aiofiles.open(snapshot_path, "w", encoding="utf-8") as f:
+        async with aiofiles.open(snapshot_path, "wb") as f:
             await f.write(content)
 
         # Create version record
@@ -330,6 +357,20 @@ class FileSystemManager:
         self.session.add(version)
         return version
 
+    def _existing_file_path(self, path: str) -> Path:
+        """Resolve a relative path to an existing file in the workspace."""
+        # Validate path
+        if not self._is_valid_path(path):
+            raise PermissionDeniedError(f"Invalid path: {path}")
+
+        # Create full path
+        full_path = self.workspace_dir / path
+
+        if not full_path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+
+        return full_path
+
     def _is_valid_path(self, path: str) -> bool:
         """Check if path is valid and safe."""
         # Prevent directory traversal attacks
@@ -339,9 +380,9 @@ class FileSystemManager:
         except (ValueError, OSError):
             return False
 
-    def _calculate_checksum(self, content: str) -> str:
+    def _calculate_checksum(self, content: bytes) -> str:
         """Calculate SHA-256 checksum of content."""
-        return hashlib.sha256(content.encode()).hexdigest()
+        return hashlib.sha256(content).hexdigest()
 
     def _get_mime_type(self, path: str) -> str:
         """Get MIME type from file extension."""
@@ -10,7 +10,7 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import MCPConnectionError, ValidationError
@@ -19,6 +19,16 @@ from app.services.mcp_adapter import MCPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Statements used on every export, import and bulk save, built once and reused
+# so each call only looks up SQLAlchemy's compiled cache
+_EXPORT_STMT = select(MCPServerConfig)
+_BY_NAMES_STMT = select(MCPServerConfig).where(
+    MCPServerConfig.name.in_(bindparam("names", expanding=True))
+)
+_BY_IDS_STMT = select(MCPServerConfig).where(
+    MCPServerConfig.id.in_(bindparam("ids", expanding=True))
+)
+
 
 class MCPConfigManager:
     """
@@ -114,6 +124,45 @@ class MCPConfigManager:
             logger.error(f"Failed to save MCP configuration: {str(e)}")
             raise ValidationError(f"Configuration save failed: {str(e)}")
 
+    async def save_configurations_bulk(
+        self, configs: List[MCPServerConfig]
+    ) -> List[MCPServerConfig]:
+        """
+        Save several MCP server configurations with one batched INSERT and commit.
+
+        Args:
+            configs: MCP server configurations
+
+        Returns:
+            Saved configurations
+
+        Raises:
+            ValidationError: If any configuration is invalid; nothing is saved
+        """
+        try:
+            for config in configs:
+                await self.validate_configuration(config)
+
+            # Rows for one table flush as a single multi-row INSERT
+            self.db.add_all(configs)
+            await self.db.flush()
+            saved_ids = [config.id for config in configs]
+            await self.db.commit()
+
+            saved = await self._reload_configurations(saved_ids)
+
+            logger.info(f"Saved {len(saved)} MCP configurations")
+
+            return saved
+
+        except ValidationError:
+            await self.db.rollback()
+            raise
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to save MCP configurations: {str(e)}")
+            raise ValidationError(f"Configuration save failed: {str(e)}")
+
     async def update_configuration(
         self, config_id: int, updates: Dict[str, Any], reconnect: bool = False
     ) -> MCPServerConfig:
@@ -371,7 +420,7 @@ class MCPConfigManager:
         Returns:
             Dictionary containing exported configurations
         """
-        query = select(MCPServerConfig)
+        query = _EXPORT_STMT
         if config_ids:
             query = query.where(MCPServerConfig.id.in_(config_ids))
 
@@ -418,39 +467,79 @@ class MCPConfigManager:
         if "servers" not in data:
             raise ValidationError("Invalid import data: missing 'servers' key")
 
+        # Look up every existing name with one query instead of one per server
+        names = {
+            server_data["name"] for server_data in data["servers"] if "name" in server_data
+        }
+        existing_by_name = {}
+        if names:
+            result = await self.db.scalars(_BY_NAMES_STMT, {"names": list(names)})
+            existing_by_name = {config.name: config for config in result}
+
         imported_configs = []
+        new_by_name: Dict[str, MCPServerConfig] = {}
 
         for server_data in data["servers"]:
             try:
-                # Check if server already exists
-                result = await self.db.execute(
-                    select(MCPServerConfig).where(MCPServerConfig.name == server_data["name"])
-                )
-                existing_config = result.scalar_one_or_none()
+                name = server_data["name"]
+                existing_config = existing_by_name.get(name)
 
-                if existing_config and not overwrite:
-                    logger.warning(f"Skipping existing server: {server_data['name']}")
+                if (existing_config or name in new_by_name) and not overwrite:
+                    logger.warning(f"Skipping existing server: {name}")
                     continue
 
-                if existing_config and overwrite:
+                if existing_config:
                     # Update existing
                     for key, value in server_data.items():
                         if hasattr(existing_config, key):
                             setattr(existing_config, key, value)
                     config = existing_config
                 else:
-                    # Create new
+                    # Create new; new servers are added together below
                     config = MCPServerConfig(**server_data)
-                    self.db.add(config)
 
                 await self.validate_configuration(config)
-                imported_configs.append(config)
+
+                if existing_config:
+                    if config not in imported_configs:
+                        imported_configs.append(config)
+                else:
+                    # A repeated name replaces the earlier entry when overwriting
+                    new_by_name.pop(name, None)
+                    new_by_name[name] = config
 
             except Exception as e:
                 logger.error(f"Failed to import server {server_data.get('name')}: {str(e)}")
                 continue
 
+        # Rows for one table flush as a single multi-row INSERT
+        self.db.add_all(new_by_name.values())
+        imported_configs.extend(new_by_name.values())
+
         await self.db.commit()
         logger.info(f"Imported {len(imported_configs)} MCP configurations")
 
         return imported_configs
+
+    async def _reload_configurations(self, config_ids: List[int]) -> List[MCPServerConfig]:
+        """
+        Reload configurations after a commit with one query.
+
+        Commits expire loaded rows; reloading keeps every attribute readable
+        without lazy loads on the async session.
+
+        Args:
+            config_ids: IDs of the configurations to reload
+
+        Returns:
+            Reloaded configurations, in the order of config_ids
+        """
+        if not config_ids:
+            return []
+
+        result = await self.db.scalars(
+            _BY_IDS_STMT.execution_options(populate_existing=True),
+            {"ids": config_ids},
+        )
+        configs_by_id = {config.id: config for config in result}
+        return [configs_by_id[config_id] for config_id in config_ids]
@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional
 from langchain_anthropic import ChatAnthropic
 from langchain_core.language_models import BaseChatModel
 from langchain_openai import ChatOpenAI
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -22,6 +22,28 @@ from app.models.config import ModelConfig
 
 logger = logging.getLogger(__name__)
 
+VALID_PROVIDERS = ["anthropic", "openai", "azure", "local", "doubao", "qianwen", "kimi"]
+
+DEFAULT_CAPABILITIES = {
+    "streaming": True,
+    "vision": False,
+    "toolUse": True,
+    "multilingual": True,
+}
+
+# Fields every imported model configuration must carry
+REQUIRED_IMPORT_FIELDS = ("provider", "label", "model_name")
+
+# Statements used on every export, import and bulk save, built once and reused
+# so each call only looks up SQLAlchemy's compiled cache
+_EXPORT_STMT = select(ModelConfig)
+_BY_LABELS_STMT = select(ModelConfig).where(
+    ModelConfig.label.in_(bindparam("labels", expanding=True))
+)
+_BY_IDS_STMT = select(ModelConfig).where(
+    ModelConfig.id.in_(bindparam("ids", expanding=True))
+)
+
 
 class ModelConfigManager:
     """
@@ -115,10 +137,9 @@ class ModelConfigManager:
         """
         try:
             # Validate provider
-            valid_providers = ["anthropic", "openai", "azure", "local", "doubao", "qianwen", "kimi"]
-            if provider not in valid_providers:
+            if provider not in VALID_PROVIDERS:
                 raise ValidationError(
-                    f"Invalid provider: {provider}. Must be one of {valid_providers}"
+                    f"Invalid provider: {provider}. Must be one of {VALID_PROVIDERS}"
                 )
 
             # Encrypt API key if provided
@@ -138,13 +159,7 @@ class ModelConfigManager:
                 api_key_secret_id=api_key_secret_id,
                 base_url=base_url,
                 is_default=is_default,
-                capabilities=capabilities
-                or {
-                    "streaming": True,
-                    "vision": False,
-                    "toolUse": True,
-                    "multilingual": True,
-                },
+                capabilities=capabilities or dict(DEFAULT_CAPABILITIES),
                 guardrails=guardrails,
             )
 
@@ -164,6 +179,77 @@ class ModelConfigManager:
             logger.error(f"Failed to save model configuration: {str(e)}")
             raise ValidationError(f"Configuration save failed: {str(e)}")
 
+    async def save_configurations_bulk(
+        self, configs: List[Dict[str, Any]]
+    ) -> List[ModelConfig]:
+        """
+        Save several model configurations with one INSERT and one commit.
+
+        Args:
+            configs: Keyword arguments for each configuration, as accepted
+                by save_configuration
+
+        Returns:
+            Saved configurations, in input order
+
+        Raises:
+            ValidationError: If any configuration is invalid; nothing is saved
+        """
+        try:
+            rows = []
+            for config_data in configs:
+                provider = config_data["provider"]
+                if provider not in VALID_PROVIDERS:
+                    raise ValidationError(
+                        f"Invalid provider: {provider}. Must be one of {VALID_PROVIDERS}"
+                    )
+
+                api_key = config_data.get("api_key")
+                rows.append(
+                    {
+                        "provider": provider,
+                        "label": config_data["label"],
+                        "model_name": config_data["model_name"],
+                        "api_key_secret_id": encrypt_api_key(api_key) if api_key else None,
+                        "base_url": config_data.get("base_url"),
+                        "is_default": config_data.get("is_default", False),
+                        "capabilities": config_data.get("capabilities")
+                        or dict(DEFAULT_CAPABILITIES),
+                        "guardrails": config_data.get("guardrails"),
+                    }
+                )
+
+            if not rows:
+                return []
+
+            # As with sequential saves, the last configuration marked default wins
+            default_indexes = [i for i, row in enumerate(rows) if row["is_default"]]
+            if default_indexes:
+                await self._unset_all_defaults()
+                for row in rows[: default_indexes[-1]]:
+                    row["is_default"] = False
+
+            result = await self.db.scalars(
+                insert(ModelConfig).returning(ModelConfig, sort_by_parameter_order=True),
+                rows,
+            )
+            saved_ids = [config.id for config in result.all()]
+            await self.db.commit()
+
+            saved = await self._reload_configurations(saved_ids)
+
+            logger.info(f"Saved {len(saved)} model configurations")
+
+            return saved
+
+        except ValidationError:
+            await self.db.rollback()
+            raise
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to save model configurations: {str(e)}")
+            raise ValidationError(f"Configuration save failed: {str(e)}")
+
     async def update_configuration(
         self, config_id: int, updates: Dict[str, Any]
     ) -> ModelConfig:
@@ -372,6 +458,30 @@ class ModelConfigManager:
             logger.error(f"Failed to create model instance: {str(e)}")
             raise ValidationError(f"Model creation failed: {str(e)}")
 
+    async def _reload_configurations(self, config_ids: List[int]) -> List[ModelConfig]:
+        """
+        Reload configurations after a commit with one query.
+
+        Commits expire loaded rows, and server-side columns such as updated_at
+        are expired by the flush that changes them; reloading keeps every
+        attribute readable without lazy loads on the async session.
+
+        Args:
+            config_ids: IDs of the configurations to reload
+
+        Returns:
+            Reloaded configurations, in the order of config_ids
+        """
+        if not config_ids:
+            return []
+
+        result = await self.db.scalars(
+            _BY_IDS_STMT.execution_options(populate_existing=True),
+            {"ids": config_ids},
+        )
+        configs_by_id = {config.id: config for config in result}
+        return [configs_by_id[config_id] for config_id in config_ids]
+
     async def _unset_all_defaults(self) -> None:
         """Unset is_default flag for all configurations."""
         result = await self.db.execute(
@@ -451,7 +561,7 @@ class ModelConfigManager:
             When exporting for backup, set include_api_keys=False and
             users will need to re-enter keys after import.
         """
-        query = select(ModelConfig)
+        query = _EXPORT_STMT
         if config_ids:
             query = query.where(ModelConfig.id.in_(config_ids))
 
@@ -513,94 +623,97 @@ class ModelConfigManager:
         if "models" not in data:
             raise ValidationError("Invalid import data: missing 'models' key")
 
-        imported_configs = []
-
+        # Entries missing a required field are skipped
+        entries = []
         for model_data in data["models"]:
-            try:
-                # Validate required fields
-                required_fields = ["provider", "label", "model_name"]
-                for field in required_fields:
-                    if field not in model_data:
-                        raise ValidationError(f"Missing required field: {field}")
-
-                # Check if model with same label already exists
-                result = await self.db.execute(
-                    select(ModelConfig).where(ModelConfig.label == model_data["label"])
+            missing = [f for f in REQUIRED_IMPORT_FIELDS if f not in model_data]
+            if missing:
+                logger.error(
+                    f"Failed to import model {model_data.get('label')}: "
+                    f"Missing required field: {missing[0]}"
                 )
-                existing_config = result.scalar_one_or_none()
-
-                if existing_config and not overwrite:
-                    logger.warning(f"Skipping existing model: {model_data['label']}")
-                    continue
-
-                if existing_config and overwrite:
-                    # Update existing
-                    existing_config.provider = model_data["provider"]
-                    existing_config.model_name = model_data["model_name"]
-                    existing_config.base_url = model_data.get("base_url")
-                    existing_config.is_default = model_data.get("is_default", False)
-                    existing_config.capabilities = model_data.get(
-                        "capabilities",
-                        {
-                            "streaming": True,
-                            "vision": False,
-                            "toolUse": True,
-                            "multilingual": True,
-                        },
-                    )
-                    existing_config.guardrails = model_data.get("guardrails")
-
-                    # Update API key if provided
-                    if model_data.get("api_key"):
-                        from app.core.security import encrypt_api_key
-                        existing_config.api_key_secret_id = encrypt_api_key(
-                            model_data["api_key"]
-                        )
-
-                    config = existing_config
-                else:
-                    # Create new
-                    api_key_secret_id = None
-                    if model_data.get("api_key"):
-                        from app.core.security import encrypt_api_key
-                        api_key_secret_id = encrypt_api_key(model_data["api_key"])
-
-                    # If this is marked as default, unset other defaults
-                    if model_data.get("is_default"):
-                        await self._unset_all_defaults()
-
-                    config = ModelConfig(
-                        provider=model_data["provider"],
-                        label=model_data["label"],
-                        model_name=model_data["model_name"],
-                        api_key_secret_id=api_key_secret_id,
-                        base_url=model_data.get("base_url"),
-                        is_default=model_data.get("is_default", False),
-                        capabilities=model_data.get(
-                            "capabilities",
-                            {
-                                "streaming": True,
-                                "vision": False,
-                                "toolUse": True,
-                                "multilingual": True,
-                            },
-                        ),
-                        guardrails=model_data.get("guardrails"),
-                    )
-                    self.db.add(config)
+                continue
+            entries.append(model_data)
+
+        # Look up every existing label with one query instead of one per entry
+        labels = {model_data["label"] for model_data in entries}
+        existing_by_label = {}
+        if labels:
+            result = await self.db.scalars(_BY_LABELS_STMT, {"labels": list(labels)})
+            existing_by_label = {config.label: config for config in result}
+
+        updated_configs = []
+        rows_by_label: Dict[str, Dict[str, Any]] = {}
 
-                imported_configs.append(config)
+        for model_data in entries:
+            label = model_data["label"]
+            existing_config = existing_by_label.get(label)
 
+            if (existing_config or label in rows_by_label) and not overwrite:
+                logger.warning(f"Skipping existing model: {label}")
+                continue
+
+            try:
+                api_key = model_data.get("api_key")
+                api_key_secret_id = encrypt_api_key(api_key) if api_key else None
             except Exception as e:
-                logger.error(f"Failed to import model {model_data.get('label')}: {str(e)}")
+                logger.error(f"Failed to import model {label}: {str(e)}")
                 # Don't fail entire import, just skip this config
                 continue
 
+            capabilities = model_data.get("capabilities", dict(DEFAULT_CAPABILITIES))
+
+            if existing_config:
+                # Update existing
+                existing_config.provider = model_data["provider"]
+                existing_config.model_name = model_data["model_name"]
+                existing_config.base_url = model_data.get("base_url")
+                existing_config.is_default = model_data.get("is_default", False)
+                existing_config.capabilities = capabilities
+                existing_config.guardrails = model_data.get("guardrails")
+
+                # Update API key if provided
+                if api_key_secret_id:
+                    existing_config.api_key_secret_id = api_key_secret_id
+
+                if existing_config not in updated_configs:
+                    updated_configs.append(existing_config)
+            else:
+                # New rows are inserted together below; a repeated label
+                # replaces the earlier entry when overwriting
+                rows_by_label.pop(label, None)
+                rows_by_label[label] = {
+                    "provider": model_data["provider"],
+                    "label": label,
+                    "model_name": model_data["model_name"],
+                    "api_key_secret_id": api_key_secret_id,
+                    "base_url": model_data.get("base_url"),
+                    "is_default": model_data.get("is_default", False),
+                    "capabilities": capabilities,
+                    "guardrails": model_data.get("guardrails"),
+                }
+
+        rows = list(rows_by_label.values())
+        inserted_configs = []
+
+        if rows:
+            # As with sequential imports, the last new configuration marked default wins
+            default_indexes = [i for i, row in enumerate(rows) if row["is_default"]]
+            if default_indexes:
+                await self._unset_all_defaults()
+                for row in rows[: default_indexes[-1]]:
+                    row["is_default"] = False
+
+            result = await self.db.scalars(
+                insert(ModelConfig).returning(ModelConfig, sort_by_parameter_order=True),
+                rows,
+            )
+            inserted_configs = list(result.all())
+
+        imported_ids = [config.id for config in updated_configs + inserted_configs]
         await self.db.commit()
 
-        # Refresh all imported configs
-        for config in imported_configs:
-            await self.db.refresh(config)
+        imported_configs = await self._reload_configurations(imported_ids)
 
         logger.info(f"Imported {len(imported_configs)} model configurations")
 
@@ -16,12 +16,23 @@ import subprocess
 import tempfile
 import zipfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import aiofiles
 
 from app.core.exceptions import SkillLoadError, SkillValidationError
 
 logger = logging.getLogger(__name__)
 
+# SKILL.md patterns, compiled once rather than on every parse
+_TITLE_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_DESCRIPTION_PATTERN = re.compile(r"## Description\s*\n(.*?)(?=\n##|\Z)", re.DOTALL)
+_INSTRUCTIONS_PATTERN = re.compile(r"## Instructions\s*\n(.*?)(?=\n##|\Z)", re.DOTALL)
+_TOOLS_PATTERN = re.compile(r"## Tools\s*\n(.*?)(?=\n##|\Z)", re.DOTALL)
+_RESOURCES_PATTERN = re.compile(r"## Resources\s*\n(.*?)(?=\n##|\Z)", re.DOTALL)
+_LIST_ITEM_PATTERN = re.compile(r"[-*]\s+(.+)")
+_SKILL_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
+
 
 class SkillLoader:
     """
@@ -55,6 +66,11 @@ class SkillLoader:
         self.active_skills: Dict[str, Dict[str, Any]] = {}
         self.sandbox_enabled = sandbox_enabled
 
+        # Bumped on every activation change; the combined instructions are
+        # rebuilt lazily when the cached copy is from an older version
+        self._version = 0
+        self._instructions_cache: Optional[Tuple[int, str]] = None
+
     async def load_skill(self, skill_path: str) -> Dict[str, Any]:
         """
         Load a skill package from a directory or zip file.
@@ -124,8 +140,8 @@ class SkillLoader:
             if not skill_md_path.exists():
                 raise SkillLoadError(f"SKILL.md not found in {skill_dir}")
 
-            with open(skill_md_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            async with aiofiles.open(skill_md_path, "r", encoding="utf-8") as f:
+                content = await f.read()
 
             metadata = {
                 "name": None,
@@ -160,35 +176,35 @@ class SkillLoader:
 
             # Extract title as name if not in frontmatter
             if not metadata["name"]:
-                title_match = re.search(r"^#\s+(.+)$", body, re.MULTILINE)
+                title_match = _TITLE_PATTERN.search(body)
                 if title_match:
                     metadata["name"] = title_match.group(1).strip()
                 else:
                     raise SkillLoadError("Skill name not found in SKILL.md")
 
             # Extract description
-            desc_match = re.search(r"## Description\s*\n(.*?)(?=\n##|\Z)", body, re.DOTALL)
+            desc_match = _DESCRIPTION_PATTERN.search(body)
             if desc_match:
                 metadata["description"] = desc_match.group(1).strip()
 
             # Extract instructions
-            inst_match = re.search(r"## Instructions\s*\n(.*?)(?=\n##|\Z)", body, re.DOTALL)
+            inst_match = _INSTRUCTIONS_PATTERN.search(body)
             if inst_match:
                 metadata["instructions"] = inst_match.group(1).strip()
 
             # Extract tools
-            tools_match = re.search(r"## Tools\s*\n(.*?)(?=\n##|\Z)", body, re.DOTALL)
+            tools_match = _TOOLS_PATTERN.search(body)
             if tools_match:
                 tools_section = tools_match.group(1).strip()
                 # Simple parsing - each bullet point is a tool
-                tool_items = re.findall(r"[-*]\s+(.+)", tools_section)
+                tool_items = _LIST_ITEM_PATTERN.findall(tools_section)
                 metadata["tools"] = [item.strip() for item in tool_items]
 
             # Extract resources
-            res_match = re.search(r"## Resources\s*\n(.*?)(?=\n##|\Z)", body, re.DOTALL)
+            res_match = _RESOURCES_PATTERN.search(body)
             if res_match:
                 resources_section = res_match.group(1).strip()
-                resource_items = re.findall(r"[-*]\s+(.+)", resources_section)
+                resource_items = _LIST_ITEM_PATTERN.findall(resources_section)
                 metadata["resources"] = [item.strip() for item in resource_items]
 
             return metadata
@@ -218,7 +234,7 @@ class SkillLoader:
                 raise SkillValidationError("Skill name is required")
 
             # Validate name format (alphanumeric, hyphens, underscores only)
-            if not re.match(r"^[a-zA-Z0-9_-]+$", metadata["name"]):
+            if not _SKILL_NAME_PATTERN.match(metadata["name"]):
                 raise SkillValidationError(
                     "Skill name must contain only letters, numbers, hyphens, and underscores"
                 )
@@ -294,6 +310,7 @@ class SkillLoader:
 
             # Activate
             self.active_skills[skill_name]["active"] = True
+            self._version += 1
 
             logger.info(f"Activated skill: {skill_name}")
 
@@ -301,6 +318,47 @@ class SkillLoader:
             logger.error(f"Failed to activate skill {skill_name}: {str(e)}")
             raise SkillLoadError(f"Skill activation failed: {str(e)}")
 
+    async def activate_skills(self, skill_names: Iterable[str]) -> None:
+        """
+        Activate several skills in one pass.
+
+        Skills that aren't loaded yet are read concurrently, and every skill is
+        loaded before any is activated, so a failure leaves the active skills
+        unchanged.
+
+        Args:
+            skill_names: Names of the skills to activate
+
+        Raises:
+            SkillLoadError: If any skill is not found or fails to load
+        """
+        skill_names = list(skill_names)
+
+        try:
+            to_load = [
+                skill_name
+                for skill_name in dict.fromkeys(skill_names)
+                if skill_name not in self.active_skills
+            ]
+            for skill_name in to_load:
+                if not (self.skills_directory / skill_name).exists():
+                    raise SkillLoadError(f"Skill {skill_name} not found")
+
+            loaded = await asyncio.gather(
+                *(self.load_skill(str(self.skills_directory / name)) for name in to_load)
+            )
+
+            self.active_skills.update(zip(to_load, loaded))
+            for skill_name in skill_names:
+                self.active_skills[skill_name]["active"] = True
+            self._version += 1
+
+            logger.info(f"Activated skills: {', '.join(skill_names)}")
+
+        except Exception as e:
+            logger.error(f"Failed to activate skills {skill_names}: {str(e)}")
+            raise SkillLoadError(f"Skill activation failed: {str(e)}")
+
     async def deactivate_skill(self, skill_name: str) -> None:
         """
         Deactivate a skill, removing its instructions from the agent.
@@ -316,6 +374,7 @@ class SkillLoader:
                 raise SkillLoadError(f"Skill {skill_name} is not loaded")
 
             self.active_skills[skill_name]["active"] = False
+            self._version += 1
 
             logger.info(f"Deactivated skill: {skill_name}")
 
@@ -330,6 +389,11 @@ class SkillLoader:
         Returns:
             Combined instructions string
         """
+        if self._instructions_cache is not None:
+            version, combined = self._instructions_cache
+            if version == self._version:
+                return combined
+
         instructions = []
 
         for skill_name, skill_data in self.active_skills.items():
@@ -338,7 +402,9 @@ class SkillLoader:
                 if skill_instructions:
                     instructions.append(f"# {skill_data['name']}\n{skill_instructions}")
 
-        return "\n\n".join(instructions)
+        combined = "\n\n".join(instructions)
+        self._instructions_cache = (self._version, combined)
+        return combined
 
     def get_active_skills(self) -> List[Dict[str, Any]]:
         """
@@ -516,12 +582,13 @@ class SkillLoader:
                 if resource_path.exists() and resource_path.is_file():
                     try:
                         # Load based on file type
+                        async with aiofiles.open(resource_path, "r", encoding="utf-8") as f:
+                            content = await f.read()
+
                         if resource_path.suffix == ".json":
-                            with open(resource_path, "r", encoding="utf-8") as f:
-                                resources[resource_file] = json.load(f)
+                            resources[resource_file] = json.loads(content)
                         else:
-                            with open(resource_path, "r", encoding="utf-8") as f:
-                                resources[resource_file] = f.read()
+                            resources[resource_file] = content
                     except Exception as e:
                         logger.warning(f"Failed to load resource {resource_file}: {str(e)}")
 
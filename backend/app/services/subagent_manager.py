@@ -1,12 +1,21 @@
 """SubAgent manager for DeepAgent."""
 import asyncio
+from bisect import bisect_right
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from hashlib import sha256
+from itertools import accumulate
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 from uuid import uuid4
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 
+# Characters of message previews offered to the context-filter LLM; it can't
+# rank meaningfully beyond this
+MAX_FILTER_SUMMARY_CHARS = 8000
+# Characters of each message shown to the context-filter LLM
+FILTER_PREVIEW_CHARS = 200
+
 
 class AgentType(str, Enum):
     """Types of sub-agents."""
@@ -17,6 +26,45 @@ class AgentType(str, Enum):
     FACT_CHECK = "fact_check"
 
 
+class _CachedSystemMessage(SystemMessage):
+    """System message whose content length is computed once."""
+
+    content_len: int = 0
+
+
+def _system_message(prompt: str) -> _CachedSystemMessage:
+    """Build a system message with its content length precomputed."""
+    return _CachedSystemMessage(content=prompt, content_len=len(prompt))
+
+
+def _message_size(msg: BaseMessage) -> int:
+    """Get message size in characters, using the cached length when available."""
+    return getattr(msg, "content_len", 0) or len(msg.content)
+
+
+def _fitting_count(messages: Iterable[BaseMessage], max_size: int) -> int:
+    """Count the leading messages whose combined size stays within max_size."""
+    return bisect_right(list(accumulate(map(_message_size, messages))), max_size)
+
+
+# System prompts are static, so each agent type's message is built once at import
+_SYSTEM_MESSAGES: Dict[AgentType, _CachedSystemMessage] = {
+    AgentType.RESEARCH: _system_message(
+        """You are a research assistant. Your task is to find and summarize relevant information on the given topic. Provide accurate, well-sourced information."""
+    ),
+    AgentType.TRANSLATION: _system_message(
+        """You are a translation specialist. Your task is to translate the provided text while preserving tone, style, and meaning. Ensure cultural appropriateness."""
+    ),
+    AgentType.EDITING: _system_message(
+        """You are an editing assistant. Your task is to improve the provided text by fixing grammar, enhancing clarity, and maintaining consistency. Preserve the author's voice."""
+    ),
+    AgentType.FACT_CHECK: _system_message(
+        """You are a fact-checking assistant. Your task is to verify claims and identify potential inaccuracies in the provided text. Provide evidence for your findings."""
+    ),
+}
+_DEFAULT_SYSTEM_MESSAGE = _system_message("You are a helpful assistant.")
+
+
 class SubAgent:
     """Represents a sub-agent with isolated context."""
 
@@ -74,6 +122,8 @@ class SubAgentManager:
         """
         self.llm = llm
         self.agents: Dict[str, SubAgent] = {}
+        # Identical requests currently awaiting the LLM, keyed by request digest
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     async def spawn_agent(
         self,
@@ -97,7 +147,7 @@ class SubAgentManager:
         agent_id = str(uuid4())
 
         # Get system prompt for agent type
-        system_prompt = self._get_system_prompt(agent_type)
+        system_message = _SYSTEM_MESSAGES.get(agent_type, _DEFAULT_SYSTEM_MESSAGE)
 
         # Filter and prepare context
         filtered_context = await self._filter_context(
@@ -109,7 +159,7 @@ class SubAgentManager:
             agent_id=agent_id,
             agent_type=agent_type,
             llm=self.llm,
-            context=[SystemMessage(content=system_prompt)] + filtered_context,
+            context=[system_message] + filtered_context,
             task_description=task_description,
         )
 
@@ -134,7 +184,7 @@ class SubAgentManager:
         tasks = []
         for agent_id in agent_ids:
             if agent_id in self.agents:
-                tasks.append(self.agents[agent_id].execute())
+                tasks.append(self._execute_coalesced(self.agents[agent_id]))
 
         # Execute in parallel
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -149,6 +199,33 @@ class SubAgentManager:
 
         return output
 
+    async def coordinate_agents_stream(
+        self,
+        agent_ids: List[str],
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Execute multiple agents in parallel, yielding results as they finish.
+
+        Args:
+            agent_ids: List of agent IDs to execute
+
+        Yields:
+            Tuples of agent ID and result, in completion order
+        """
+        tasks = [
+            asyncio.create_task(self._execute_agent(agent_id))
+            for agent_id in agent_ids
+            if agent_id in self.agents
+        ]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early; don't leave agents running in the background
+            for task in tasks:
+                task.cancel()
+
     async def collect_results(self, agent_ids: List[str]) -> List[Dict[str, Any]]:
         """
         Collect results from agents.
@@ -174,15 +251,63 @@ class SubAgentManager:
 
         return results
 
-    def _get_system_prompt(self, agent_type: AgentType) -> str:
-        """Get system prompt for agent type."""
-        prompts = {
-            AgentType.RESEARCH: """You are a research assistant. Your task is to find and summarize relevant information on the given topic. Provide accurate, well-sourced information.""",
-            AgentType.TRANSLATION: """You are a translation specialist. Your task is to translate the provided text while preserving tone, style, and meaning. Ensure cultural appropriateness.""",
-            AgentType.EDITING: """You are an editing assistant. Your task is to improve the provided text by fixing grammar, enhancing clarity, and maintaining consistency. Preserve the author's voice.""",
-            AgentType.FACT_CHECK: """You are a fact-checking assistant. Your task is to verify claims and identify potential inaccuracies in the provided text. Provide evidence for your findings.""",
-        }
-        return prompts.get(agent_type, "You are a helpful assistant.")
+    async def _execute_agent(self, agent_id: str) -> Tuple[str, str]:
+        """Execute a single agent, reporting failures as an error result."""
+        try:
+            return agent_id, await self._execute_coalesced(self.agents[agent_id])
+        except Exception as e:
+            return agent_id, f"Error: {str(e)}"
+
+    async def _execute_coalesced(self, agent: SubAgent) -> str:
+        """
+        Execute an agent, sharing one LLM call between identical in-flight requests.
+
+        Args:
+            agent: Agent to execute
+
+        Returns:
+            Task result
+        """
+        key = self._request_key(agent)
+
+        pending = self._inflight.get(key)
+        while pending is not None:
+            try:
+                # Shield so a cancelled waiter doesn't cancel the shared call
+                agent.result = await asyncio.shield(pending)
+                return agent.result
+            except asyncio.CancelledError:
+                # Only this caller's own cancellation propagates; if the call's
+                # owner was cancelled instead, join or make the call again
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            pending = self._inflight.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await agent.execute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unshared failure isn't logged as unhandled
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    def _request_key(self, agent: SubAgent) -> str:
+        """Build a digest identifying the LLM request an agent will make."""
+        digest = sha256(agent.agent_type.value.encode())
+        for msg in agent.context:
+            digest.update(f"\0{msg.type}\0{msg.content}".encode())
+        digest.update(f"\0{agent.task_description}".encode())
+        return digest.hexdigest()
 
     async def _filter_context(
         self,
@@ -205,7 +330,7 @@ class SubAgentManager:
             return []
 
         # Calculate total size
-        total_size = sum(len(msg.content) for msg in context)
+        total_size = sum(_message_size(msg) for msg in context)
 
         # If under limit, return all
         if total_size <= max_size:
@@ -218,10 +343,21 @@ Task: {task_description}
 
 Return the indices of relevant messages (0-indexed) as a JSON array. Example: [0, 2, 5]"""
 
-        # Create context summary
-        context_summary = "\n\n".join(
-            [f"[{i}] {msg.content[:200]}..." for i, msg in enumerate(context)]
-        )
+        # Create context summary, stopping once the previews exceed the budget
+        previews = []
+        summary_size = 0
+        for i, msg in enumerate(context):
+            preview = (
+                f"[{i}] {msg.content[:FILTER_PREVIEW_CHARS]}..."
+                if len(msg.content) > FILTER_PREVIEW_CHARS
+                else f"[{i}] {msg.content}"
+            )
+            # Each preview after the first also costs its "\n\n" separator
+            summary_size += len(preview) + (2 if previews else 0)
+            if summary_size > MAX_FILTER_SUMMARY_CHARS:
+                break
+            previews.append(preview)
+        context_summary = "\n\n".join(previews)
 
         messages = [
             SystemMessage(content=system_prompt),
@@ -237,29 +373,9 @@ Return the indices of relevant messages (0-indexed) as a JSON array. Example: [0
             indices = json.loads(response.content)
             filtered = [context[i] for i in indices if i < len(context)]
 
-            # Ensure we're under the limit
-            filtered_size = sum(len(msg.content) for msg in filtered)
-            if filtered_size > max_size:
-                # Truncate messages
-                result = []
-                current_size = 0
-                for msg in filtered:
-                    if current_size + len(msg.content) <= max_size:
-                        result.append(msg)
-                        current_size += len(msg.content)
-                    else:
-                        break
-                return result
-
-            return filtered
+            # Ensure we're under the limit, stopping at the first message that doesn't fit
+            return filtered[: _fitting_count(filtered, max_size)]
         except (json.JSONDecodeError, IndexError):
             # Fallback: take most recent messages
-            result = []
-            current_size = 0
-            for msg in reversed(context):
-                if current_size + len(msg.content) <= max_size:
-                    result.insert(0, msg)
-                    current_size += len(msg.content)
-                else:
-                    break
-            return result
+            count = _fitting_count(reversed(context), max_size)
+            return context[len(context) - count :]
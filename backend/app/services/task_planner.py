@@ -1,6 +1,10 @@
 """Task planner for DeepAgent."""
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import copy
+import json
+from collections import OrderedDict
+from datetime import datetime, timezone
+from hashlib import sha256
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 from langchain_core.language_models import BaseChatModel
@@ -10,6 +14,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.task import TodoTask, WritingPlan
 
+# Maximum number of analyzed goals kept in the plan-template cache
+PLAN_CACHE_SIZE = 256
+
 
 class TaskPlanner:
     """Plans and manages writing tasks using LLM analysis."""
@@ -24,6 +31,7 @@ class TaskPlanner:
         """
         self.session = session
         self.llm = llm
+        self._plan_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
 
     async def analyze_goal(self, goal: str, context: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -36,6 +44,13 @@ class TaskPlanner:
         Returns:
             Dictionary with analyzed goal and suggested tasks
         """
+        # Recurring goals reuse the previously analyzed plan template; hits
+        # return a copy so callers cannot alter the cached template
+        cache_key = sha256(f"{goal}\0{context or ''}".encode()).hexdigest()
+        if cache_key in self._plan_cache:
+            self._plan_cache.move_to_end(cache_key)
+            return copy.deepcopy(self._plan_cache[cache_key])
+
         system_prompt = """You are a writing task planner. Analyze the user's writing goal and break it down into concrete, actionable tasks.
 
 For each task, identify:
@@ -72,11 +87,8 @@ Ensure tasks form a DAG (Directed Acyclic Graph) - no circular dependencies."""
         response = await self.llm.ainvoke(messages)
 
         # Parse response
-        import json
-
         try:
             result = json.loads(response.content)
-            return result
         except json.JSONDecodeError:
             # Fallback to basic task structure
             return {
@@ -92,12 +104,19 @@ Ensure tasks form a DAG (Directed Acyclic Graph) - no circular dependencies."""
                 ],
             }
 
+        self._plan_cache[cache_key] = copy.deepcopy(result)
+        if len(self._plan_cache) > PLAN_CACHE_SIZE:
+            self._plan_cache.popitem(last=False)
+
+        return result
+
     async def create_todos(
         self,
         workspace_id: str,
         goal: str,
         page_id: Optional[str] = None,
         context: Optional[str] = None,
+        refresh: bool = True,
     ) -> WritingPlan:
         """
         Create a writing plan with todo tasks.
@@ -107,6 +126,8 @@ Ensure tasks form a DAG (Directed Acyclic Graph) - no circular dependencies."""
             goal: Writing goal
             page_id: Optional page ID
             context: Optional context
+            refresh: Reload the plan after commit; callers that do not read
+                it back can skip the extra SELECT
 
         Returns:
             Created WritingPlan instance
@@ -143,7 +164,8 @@ Ensure tasks form a DAG (Directed Acyclic Graph) - no circular dependencies."""
             self.session.add(task)
 
         await self.session.commit()
-        await self.session.refresh(plan)
+        if refresh:
+            await self.session.refresh(plan)
 
         return plan
 
@@ -151,6 +173,7 @@ Ensure tasks form a DAG (Directed Acyclic Graph) - no circular dependencies."""
         self,
         plan_id: UUID,
         updates: Dict[str, Any],
+        refresh: bool = True,
     ) -> WritingPlan:
         """
         Update a writing plan.
@@ -158,6 +181,8 @@ Ensure tasks form a DAG (Directed Acyclic Graph) - no circular dependencies."""
         Args:
             plan_id: Plan ID
             updates: Dictionary of updates
+            refresh: Reload the plan after commit; progress ticks that do not
+                read it back can skip the extra SELECT
 
         Returns:
             Updated WritingPlan instance
@@ -176,10 +201,11 @@ Ensure tasks form a DAG (Directed Acyclic Graph) - no circular dependencies."""
             if hasattr(plan, key):
                 setattr(plan, key, value)
 
-        plan.updated_at = datetime.utcnow()
+        plan.updated_at = datetime.now(timezone.utc)
 
         await self.session.commit()
-        await self.session.refresh(plan)
+        if refresh:
+            await self.session.refresh(plan)
 
         return plan
 
@@ -205,11 +231,14 @@ Ensure tasks form a DAG (Directed Acyclic Graph) - no circular dependencies."""
         )
         tasks = tasks_result.scalars().all()
 
+        # Index tasks once instead of per dependency check
+        task_map = {str(task.id): task for task in tasks}
+
         # Find next available task
         for task in tasks:
             if task.status == "pending":
                 # Check if dependencies are met
-                if await self._are_dependencies_met(task, tasks):
+                if await self._are_dependencies_met(task, task_map):
                     return task
 
         return None
@@ -262,13 +291,13 @@ Ensure tasks form a DAG (Directed Acyclic Graph) - no circular dependencies."""
 
         return {"valid": True}
 
-    async def _are_dependencies_met(self, task: TodoTask, all_tasks: List[TodoTask]) -> bool:
+    async def _are_dependencies_met(
+        self, task: TodoTask, task_map: Dict[str, TodoTask]
+    ) -> bool:
         """Check if all task dependencies are completed."""
         if not task.dependencies:
             return True
 
-        task_map = {str(t.id): t for t in all_tasks}
-
         for dep_id in task.dependencies:
             if dep_id in task_map:
                 dep_task = task_map[dep_id]
@@ -1,13 +1,43 @@
 """Pytest configuration and fixtures."""
+import os
 import tempfile
+from datetime import timedelta
+from uuid import uuid4
 
 import pytest
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text, create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    create_engine,
+    create_mock_engine,
+    event,
+)
+from sqlalchemy import types as sqltypes
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.dialects.sqlite.json import JSON as SQLiteJSON
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import NullPool, StaticPool
 
 from app.db.base import Base
 
+
+# The app's models use PostgreSQL-only JSONB and ARRAY columns; store both as
+# JSON so their schema can be created on the SQLite test engines
+@compiles(JSONB, "sqlite")
+@compiles(ARRAY, "sqlite")
+def _compile_json_on_sqlite(type_, compiler, **kw):
+    """Render JSONB and ARRAY columns as SQLite JSON."""
+    return "JSON"
+
+
 # Create a test base compatible with SQLite
 TestBase = declarative_base()
 
@@ -145,15 +175,141 @@ def db_session(engine) -> Session:
     session.close()
 
 
+@pytest.fixture(scope="session")
+def test_engine():
+    """Create the SQLite engine shared by the model test modules.
+
+    Yields:
+        Engine on a named in-memory database with SAVEPOINT support
+    """
+    # A named in-memory database, so any connection in this process opens the
+    # same schema and page cache; the pid keeps parallel workers apart
+    engine = create_engine(
+        f"sqlite:///file:models-{os.getpid()}?mode=memory&cache=shared&uri=true",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs behave under pysqlite
+        dbapi_connection.isolation_level = None
+
+        # The database is throwaway, so skip durability work on every commit
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def test_connection(test_engine):
+    """Open one connection whose outer transaction is never committed."""
+    with test_engine.connect() as conn:
+        trans = conn.begin()
+        yield conn
+        trans.rollback()
+
+
+@pytest.fixture(scope="module")
+def test_schema(request, test_connection):
+    """Create the requesting module's ``TestBase`` tables once per module."""
+    request.module.TestBase.metadata.create_all(bind=test_connection)
+
+
+@pytest.fixture(scope="function")
+def test_session(test_connection, test_schema) -> Session:
+    """Create a new database session for a test, rolling back its writes afterwards.
+
+    Args:
+        test_connection: Shared connection in its outer transaction
+        test_schema: Ensures the module's tables exist
+
+    Yields:
+        Database session joined to a per-test savepoint
+    """
+    savepoint = test_connection.begin_nested()
+    # The test's commits only release savepoints inside the one above
+    session = Session(
+        bind=test_connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+    yield session
+    session.close()
+    savepoint.rollback()
+
+
+def _compile_sqlite_ddl(metadata):
+    """Compile a metadata's CREATE statements for SQLite without a live connection.
+
+    Args:
+        metadata: Metadata whose tables and indexes are compiled
+
+    Returns:
+        Coroutine function replaying the compiled DDL on a connection
+    """
+    statements = []
+
+    def _capture(sql, *multiparams, **params):
+        statements.append(str(sql.compile(dialect=mock_engine.dialect)))
+
+    mock_engine = create_mock_engine("sqlite://", _capture)
+    metadata.create_all(mock_engine, checkfirst=False)
+
+    async def _create_schema(conn):
+        # JSONB already binds through SQLite's JSON type; map ARRAY onto it as
+        # well, on this engine's dialect only, so list values are serialized on
+        # write and decoded on read
+        dialect = conn.dialect
+        dialect.colspecs = {**type(dialect).colspecs, sqltypes.ARRAY: SQLiteJSON}
+
+        for statement in statements:
+            await conn.exec_driver_sql(statement)
+
+    return _create_schema
+
+
+@pytest.fixture(scope="session")
+def create_schema():
+    """Compile the app schema's SQLite DDL once and replay it on each test engine.
+
+    Returns:
+        Coroutine function creating all tables on a connection
+    """
+    return _compile_sqlite_ddl(Base.metadata)
+
+
+@pytest.fixture(scope="session")
+def create_test_schema():
+    """Compile the SQLite test models' DDL once and replay it on each test engine.
+
+    Returns:
+        Coroutine function creating all test tables on a connection
+    """
+    return _compile_sqlite_ddl(TestBase.metadata)
+
+
 @pytest.fixture
-async def test_db():
+async def test_db(create_test_schema):
     """Create an async test database."""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:", poolclass=StaticPool, echo=False
+    )
 
     async with engine.begin() as conn:
-        await conn.run_sync(TestBase.metadata.create_all)
+        await create_test_schema(conn)
 
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
 
     async with async_session() as session:
         yield session
@@ -173,3 +329,60 @@ async def file_system_manager(test_db):
             session=test_db,
         )
         yield manager
+
+
+@pytest.fixture(scope="session")
+def skills_root(tmp_path_factory):
+    """Create one base directory for every test's skills."""
+    return tmp_path_factory.mktemp("skills")
+
+
+@pytest.fixture
+def skills_dir(skills_root):
+    """Create an empty skills directory for a single test."""
+    skills_dir = skills_root / uuid4().hex
+    skills_dir.mkdir()
+    return skills_dir
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create one API test client, running the app's lifespan once per session."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def test_access_token():
+    """Sign one access token for the session; it outlives any test run."""
+    from app.core.security import create_access_token
+
+    return create_access_token(subject="test-user-id", expires_delta=timedelta(days=1))
+
+
+@pytest.fixture(scope="session")
+def db_available() -> bool:
+    """Check once whether the configured application database accepts connections."""
+    from app.core.config import settings
+
+    probe = create_engine(
+        settings.database_url, poolclass=NullPool, connect_args={"connect_timeout": 1}
+    )
+    try:
+        with probe.connect():
+            return True
+    except OperationalError:
+        return False
+    finally:
+        probe.dispose()
+
+
+@pytest.fixture
+def require_db(db_available: bool) -> None:
+    """Skip the test when the application database isn't running."""
+    if not db_available:
+        pytest.skip("database not running")
@@ -1,44 +1,26 @@
 """Integration tests for DeepAgent."""
-import tempfile
+from uuid import uuid4
 
 import pytest
-from langchain_core.embeddings import FakeEmbeddings
+import pytest_asyncio
+from langchain_core.embeddings import Embeddings
 from langchain_core.messages import AIMessage
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 from unittest.mock import AsyncMock
 
-from app.db.base import Base
 from app.services.deep_agent import DeepAgent
 
+# Keep this module on one xdist worker so it shares a single session-scoped
+# engine, and run it on one session-wide loop so that engine stays usable
+pytestmark = [
+    pytest.mark.xdist_group("deep_agent"),
+    pytest.mark.asyncio(loop_scope="session"),
+]
 
-@pytest.fixture
-async def test_db():
-    """Create a test database."""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-    async with async_session() as session:
-        yield session
-
-    await engine.dispose()
-
-
-@pytest.fixture
-def mock_llm():
-    """Create a mock LLM with various responses."""
-    llm = AsyncMock()
-
-    # Default response
-    def mock_response(*args, **kwargs):
-        messages = args[0] if args else []
-        if any("task" in str(msg).lower() for msg in messages):
-            return AIMessage(
-                content="""{
+_PLAN_MSG = AIMessage(
+    content="""{
   "analysis": "Write a comprehensive blog post",
   "tasks": [
     {
@@ -57,29 +39,120 @@ def mock_llm():
     }
   ]
 }"""
-            )
-        return AIMessage(content="Task completed successfully.")
+)
+_TASK_MSG = AIMessage(content="Task completed successfully.")
+# Non-zero so vector stores using cosine similarity accept it
+_EMBEDDING = [0.1] * 1536
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def engine(create_schema):
+    """Create the test database engine and schema once per session."""
+    # A single pooled connection means aiosqlite starts one worker thread for the
+    # whole session instead of one per checkout
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool, echo=False)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs behave under pysqlite
+        dbapi_connection.isolation_level = None
+
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await create_schema(conn)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def async_session_factory():
+    """Create the session factory once; each test binds it to its own connection."""
+    return async_sessionmaker(expire_on_commit=False, join_transaction_mode="create_savepoint")
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def test_db(engine, async_session_factory):
+    """Create a test session rolled back after each test."""
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+
+        async with async_session_factory(bind=conn) as session:
+            yield session
+
+        await trans.rollback()
 
-    llm.ainvoke.side_effect = mock_response
-    return llm
+
+def mock_response(messages):
+    """Return the canned plan for planning prompts and a task result otherwise."""
+    if any("task" in (getattr(msg, "content", "") or "").lower() for msg in messages):
+        return _PLAN_MSG
+    return _TASK_MSG
+
+
+class _FakeLLM:
+    """Minimal LLM stub; skips AsyncMock's per-call recording on hot paths."""
+
+    async def ainvoke(self, messages, **kwargs):
+        return mock_response(messages)
 
 
 @pytest.fixture
-async def deep_agent(test_db, mock_llm):
+def mock_llm():
+    """Create a fake LLM with canned responses."""
+    return _FakeLLM()
+
+
+class _ConstEmbeddings(Embeddings):
+    """Embedding stub returning one shared vector instead of generating random ones."""
+
+    def embed_documents(self, texts):
+        return [_EMBEDDING] * len(texts)
+
+    def embed_query(self, text):
+        return _EMBEDDING
+
+    async def aembed_documents(self, texts):
+        return self.embed_documents(texts)
+
+    async def aembed_query(self, text):
+        return self.embed_query(text)
+
+
+@pytest.fixture(scope="session")
+def embeddings():
+    """Create the embedding stub once per session."""
+    return _ConstEmbeddings()
+
+
+def _build_agent(session, llm, embeddings, base_path) -> DeepAgent:
+    """Create a DeepAgent isolated by a unique workspace."""
+    return DeepAgent(
+        workspace_id=f"ws-{uuid4()}",
+        session=session,
+        llm=llm,
+        embeddings=embeddings,
+        base_path=base_path,
+    )
+
+
+@pytest.fixture
+def deep_agent(test_db, mock_llm, embeddings, tmp_path_factory):
     """Create a DeepAgent for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        embeddings = FakeEmbeddings(size=1536)
-        agent = DeepAgent(
-            workspace_id="test-workspace",
-            session=test_db,
-            llm=mock_llm,
-            embeddings=embeddings,
-            base_path=tmpdir,
-        )
-        yield agent
-
-
-@pytest.mark.asyncio
+    return _build_agent(test_db, mock_llm, embeddings, str(tmp_path_factory.mktemp("agent")))
+
+
 async def test_deep_agent_workflow(deep_agent: DeepAgent):
     """Test the complete DeepAgent workflow."""
     result = await deep_agent.run("Write a blog post about AI trends in 2024")
@@ -89,7 +162,6 @@ async def test_deep_agent_workflow(deep_agent: DeepAgent):
     assert "plan_id" in result
 
 
-@pytest.mark.asyncio
 async def test_deep_agent_file_creation(deep_agent: DeepAgent):
     """Test that DeepAgent creates files."""
     result = await deep_agent.run("Write a technical article")
@@ -99,7 +171,6 @@ async def test_deep_agent_file_creation(deep_agent: DeepAgent):
     # This depends on the workflow implementation
 
 
-@pytest.mark.asyncio
 async def test_deep_agent_task_planning(deep_agent: DeepAgent):
     """Test task planning component."""
     result = await deep_agent.run("Create a research report")
@@ -108,12 +179,11 @@ async def test_deep_agent_task_planning(deep_agent: DeepAgent):
     assert result.get("plan_id") is not None
 
 
-@pytest.mark.asyncio
 async def test_deep_agent_memory_integration(deep_agent: DeepAgent):
     """Test memory manager integration."""
     # Store a memory first
     await deep_agent.memory_manager.store_style_profile(
-        workspace_id="test-workspace",
+        workspace_id=deep_agent.workspace_id,
         samples=["Professional writing sample"],
         title="Test Style",
     )
@@ -124,11 +194,13 @@ async def test_deep_agent_memory_integration(deep_agent: DeepAgent):
     assert result is not None
 
 
-@pytest.mark.asyncio
-async def test_deep_agent_error_handling(deep_agent: DeepAgent):
+async def test_deep_agent_error_handling(test_db, embeddings, tmp_path_factory):
     """Test error handling in workflow."""
     # Mock LLM to raise an error
-    deep_agent.llm.ainvoke.side_effect = Exception("Test error")
+    failing_llm = AsyncMock()
+    failing_llm.ainvoke.side_effect = Exception("Test error")
+    base_path = str(tmp_path_factory.mktemp("agent"))
+    deep_agent = _build_agent(test_db, failing_llm, embeddings, base_path)
 
     # Agent should handle errors gracefully
     try:
@@ -138,7 +210,6 @@ async def test_deep_agent_error_handling(deep_agent: DeepAgent):
         assert str(e) == "Test error"
 
 
-@pytest.mark.asyncio
 async def test_deep_agent_multiple_tasks(deep_agent: DeepAgent):
     """Test executing multiple tasks in sequence."""
     result = await deep_agent.run("Write a report with research and editing")
@@ -1,24 +1,179 @@
 """Locust load testing configuration."""
+import itertools
 import json
+import logging
 import random
-from locust import HttpUser, between, task
+import uuid
+from pathlib import Path
+
+import orjson
+from gevent.lock import Semaphore
+from locust import FastHttpUser, between, events, task
+from locust.runners import MasterRunner, WorkerRunner
+
+# Imported after locust so gevent has already monkey-patched ssl/socket
+import requests  # isort: skip
+
+logger = logging.getLogger(__name__)
+
+# Number of accounts registered up front and shared across simulated users
+TOKEN_POOL_SIZE = 200
+
+# Pool accounts are saved here so later runs log in instead of registering again
+CREDENTIALS_FILE = Path(__file__).with_name("locust_users.json")
+
+# Registration rejects an email that is already taken with one of these
+ALREADY_REGISTERED = (400, 409)
+
+# Request bodies are built once at import so tasks spend their time on I/O
+PAYLOAD_COUNT = 1000
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+_rng = random.Random(42)
+_WORKSPACE_PAYLOADS = [
+    orjson.dumps(
+        {
+            "name": f"Test Workspace {_rng.randint(1, 1000)}",
+            "description": "Test workspace for load testing",
+        }
+    )
+    for _ in range(PAYLOAD_COUNT)
+]
+# Page bodies need the user's workspace ID, so they're completed per request
+_PAGE_PAYLOADS = [
+    {
+        "title": f"Test Page {_rng.randint(1, 1000)}",
+        "content": "This is test content for load testing.",
+    }
+    for _ in range(PAYLOAD_COUNT)
+]
+_PAGE_UPDATE_PAYLOADS = [
+    orjson.dumps(
+        {
+            "title": f"Updated Page {_rng.randint(1, 1000)}",
+            "content": "This is updated content for load testing.",
+        }
+    )
+    for _ in range(PAYLOAD_COUNT)
+]
+_STRESS_WORKSPACE_PAYLOADS = [
+    orjson.dumps(
+        {
+            "name": f"Stress Workspace {_rng.randint(1, 10000)}",
+            "description": "Stress test workspace",
+        }
+    )
+    for _ in range(PAYLOAD_COUNT)
+]
+
+_CREDENTIALS: list[dict[str, str]] = []
+_TOKEN_POOL: list[str] = []
+_token_lock = Semaphore()
+_token_index = 0
+_credentials_index = 0
+
+
+def _login_saved_accounts(session, host):
+    """Log in the accounts saved by a previous run, filling the token pool."""
+    for credentials in json.loads(CREDENTIALS_FILE.read_text()):
+        response = session.post(f"{host}/api/v1/auth/login", json=credentials)
+        if response.status_code == 200:
+            _CREDENTIALS.append(credentials)
+            _TOKEN_POOL.append(response.json()["access_token"])
+
+
+def _register_pool_accounts(session, host, save_credentials):
+    """Register fresh pool accounts, optionally saving their credentials for later runs."""
+    for _ in range(TOKEN_POOL_SIZE):
+        credentials = {
+            "email": f"pool_{uuid.uuid4().hex}@example.com",
+            "password": "TestPassword123",
+        }
+        # Registration already returns an access token, so no login is needed
+        response = session.post(
+            f"{host}/api/v1/auth/register",
+            json={**credentials, "full_name": "Pool User"},
+        )
+        if response.status_code in (200, 201):
+            _CREDENTIALS.append(credentials)
+            _TOKEN_POOL.append(response.json()["access_token"])
+
+    if save_credentials and _CREDENTIALS:
+        CREDENTIALS_FILE.write_text(json.dumps(_CREDENTIALS))
+
+
+@events.test_start.add_listener
+def prefetch_tokens(environment, **kwargs):
+    """Fill the token pool once so users don't each register and log in."""
+    if isinstance(environment.runner, MasterRunner):
+        return
+
+    host = environment.host or MusetUser.host
+    # Distributed workers would race to write the same file, so only a local
+    # run saves its accounts
+    save_credentials = not isinstance(environment.runner, WorkerRunner)
+
+    with requests.Session() as session:
+        try:
+            if CREDENTIALS_FILE.exists():
+                _login_saved_accounts(session, host)
+            # Nothing saved, or the target's database was reset since
+            if not _TOKEN_POOL:
+                _register_pool_accounts(session, host, save_credentials)
+        except requests.RequestException:
+            # Target unreachable; users fall back to registering themselves
+            logger.warning("Could not prefetch auth tokens from %s", host)
+
+
+def next_auth_headers():
+    """Get auth headers for the next pooled token, or None if the pool is empty."""
+    global _token_index
+
+    with _token_lock:
+        if not _TOKEN_POOL:
+            return None
+        token = _TOKEN_POOL[_token_index % len(_TOKEN_POOL)]
+        _token_index += 1
+
+    return {"Authorization": f"Bearer {token}"}
+
+
+def next_credentials():
+    """Get the next known-good account, or None if none are available."""
+    global _credentials_index
 
+    with _token_lock:
+        if not _CREDENTIALS:
+            return None
+        credentials = _CREDENTIALS[_credentials_index % len(_CREDENTIALS)]
+        _credentials_index += 1
 
-class MusetUser(HttpUser):
+    return credentials
+
+
+class MusetUser(FastHttpUser):
     """Simulate Muset application user."""
 
     wait_time = between(1, 5)  # Wait 1-5 seconds between requests
     host = "http://localhost:7989"
+    network_timeout = 60.0
+    connection_timeout = 60.0
+    insecure = True  # Skip TLS verification against local targets
 
     def on_start(self):
         """Initialize user session."""
-        # Register/login user
-        self.register_user()
-        self.login()
+        # Reuse a pooled token; only register/login if the pool couldn't be filled
+        self.headers = next_auth_headers()
+        if self.headers is None:
+            self.register_user()
+            self.login()
+
+        self.json_headers = {**self.headers, **JSON_HEADERS}
+        self._cycle = itertools.cycle(range(PAYLOAD_COUNT))
 
     def register_user(self):
         """Register a new user."""
-        email = f"test_{random.randint(1000, 9999)}@example.com"
+        email = f"test_{uuid.uuid4().hex}@example.com"
         password = "TestPassword123"
 
         response = self.client.post(
@@ -31,13 +186,14 @@ class MusetUser(HttpUser):
             name="/api/v1/auth/register",
         )
 
-        if response.status_code == 200:
-            self.email = email
-            self.password = password
-        elif response.status_code == 409:
-            # User already exists, use existing credentials
-            self.email = email
-            self.password = password
+        if response.status_code in ALREADY_REGISTERED:
+            # Email taken by someone else; its password isn't ours, so use a known account
+            credentials = next_credentials()
+            if credentials is not None:
+                email, password = credentials["email"], credentials["password"]
+
+        self.email = email
+        self.password = password
 
     def login(self):
         """Login user."""
@@ -55,6 +211,9 @@ class MusetUser(HttpUser):
             self.token = data.get("access_token")
             self.headers = {"Authorization": f"Bearer {self.token}"}
         else:
+            logger.warning(
+                "Login failed for %s with status %s", self.email, response.status_code
+            )
             self.headers = {}
 
     @task(3)
@@ -78,11 +237,8 @@ class MusetUser(HttpUser):
         if hasattr(self, "headers"):
             response = self.client.post(
                 "/api/v1/workspaces",
-                headers=self.headers,
-                json={
-                    "name": f"Test Workspace {random.randint(1, 1000)}",
-                    "description": "Test workspace for load testing",
-                },
+                headers=self.json_headers,
+                data=_WORKSPACE_PAYLOADS[next(self._cycle)],
                 name="/api/v1/workspaces [POST]",
             )
 
@@ -106,12 +262,10 @@ class MusetUser(HttpUser):
         if hasattr(self, "headers") and hasattr(self, "workspace_id"):
             response = self.client.post(
                 "/api/v1/pages",
-                headers=self.headers,
-                json={
-                    "workspace_id": self.workspace_id,
-                    "title": f"Test Page {random.randint(1, 1000)}",
-                    "content": "This is test content for load testing.",
-                },
+                headers=self.json_headers,
+                data=orjson.dumps(
+                    {"workspace_id": self.workspace_id, **_PAGE_PAYLOADS[next(self._cycle)]}
+                ),
                 name="/api/v1/pages [POST]",
             )
 
@@ -125,11 +279,8 @@ class MusetUser(HttpUser):
         if hasattr(self, "headers") and hasattr(self, "page_id"):
             self.client.put(
                 f"/api/v1/pages/{self.page_id}",
-                headers=self.headers,
-                json={
-                    "title": f"Updated Page {random.randint(1, 1000)}",
-                    "content": "This is updated content for load testing.",
-                },
+                headers=self.json_headers,
+                data=_PAGE_UPDATE_PAYLOADS[next(self._cycle)],
                 name="/api/v1/pages/{id} [PUT]",
             )
 
@@ -154,11 +305,14 @@ class MusetUser(HttpUser):
             )
 
 
-class HighLoadUser(HttpUser):
+class HighLoadUser(FastHttpUser):
     """Simulate high-load scenarios."""
 
     wait_time = between(0.1, 0.5)  # Very short wait time
     host = "http://localhost:7989"
+    network_timeout = 60.0
+    connection_timeout = 60.0
+    insecure = True
 
     @task(10)
     def rapid_health_checks(self):
@@ -171,20 +325,28 @@ class HighLoadUser(HttpUser):
         self.client.get("/api/v1/health", name="/api/v1/health [rapid]")
 
 
-class StressTestUser(HttpUser):
+class StressTestUser(FastHttpUser):
     """Simulate stress test scenarios."""
 
     wait_time = between(0, 1)
     host = "http://localhost:7989"
+    network_timeout = 60.0
+    connection_timeout = 60.0
+    insecure = True
 
     def on_start(self):
         """Initialize user session."""
-        self.register_user()
-        self.login()
+        self.headers = next_auth_headers()
+        if self.headers is None:
+            self.register_user()
+            self.login()
+
+        self.json_headers = {**self.headers, **JSON_HEADERS}
+        self._cycle = itertools.cycle(range(PAYLOAD_COUNT))
 
     def register_user(self):
         """Register a new user."""
-        email = f"stress_{random.randint(1000, 99999)}@example.com"
+        email = f"stress_{uuid.uuid4().hex}@example.com"
         password = "TestPassword123"
 
         response = self.client.post(
@@ -197,12 +359,14 @@ class StressTestUser(HttpUser):
             name="/api/v1/auth/register [stress]",
         )
 
-        if response.status_code == 200:
-            self.email = email
-            self.password = password
-        elif response.status_code == 409:
-            self.email = email
-            self.password = password
+        if response.status_code in ALREADY_REGISTERED:
+            # Email taken by someone else; its password isn't ours, so use a known account
+            credentials = next_credentials()
+            if credentials is not None:
+                email, password = credentials["email"], credentials["password"]
+
+        self.email = email
+        self.password = password
 
     def login(self):
         """Login user."""
@@ -220,6 +384,9 @@ class StressTestUser(HttpUser):
             self.token = data.get("access_token")
             self.headers = {"Authorization": f"Bearer {self.token}"}
         else:
+            logger.warning(
+                "Login failed for %s with status %s", self.email, response.status_code
+            )
             self.headers = {}
 
     @task
@@ -229,10 +396,7 @@ class StressTestUser(HttpUser):
             for i in range(5):
                 self.client.post(
                     "/api/v1/workspaces",
-                    headers=self.headers,
-                    json={
-                        "name": f"Stress Workspace {random.randint(1, 10000)}",
-                        "description": "Stress test workspace",
-                    },
+                    headers=self.json_headers,
+                    data=_STRESS_WORKSPACE_PAYLOADS[next(self._cycle)],
                     name="/api/v1/workspaces [POST stress]",
                 )
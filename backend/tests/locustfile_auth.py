@@ -0,0 +1,42 @@
+"""Locust load test for the auth endpoints.
+
+Kept apart from locustfile.py, whose users share pre-registered tokens, so
+auth traffic only runs when this file is selected explicitly.
+"""
+import uuid
+
+from locust import FastHttpUser, between, task
+
+
+class AuthUser(FastHttpUser):
+    """Exercise the auth endpoints, which the other users skip via the token pool."""
+
+    wait_time = between(1, 5)
+    host = "http://localhost:7989"
+    network_timeout = 60.0
+    connection_timeout = 60.0
+    insecure = True
+
+    @task
+    def register_and_login(self):
+        """Register a fresh user and log in."""
+        email = f"auth_{uuid.uuid4().hex}@example.com"
+        password = "TestPassword123"
+
+        self.client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": email,
+                "password": password,
+                "full_name": "Auth Test User",
+            },
+            name="/api/v1/auth/register",
+        )
+        self.client.post(
+            "/api/v1/auth/login",
+            json={
+                "email": email,
+                "password": password,
+            },
+            name="/api/v1/auth/login",
+        )
@@ -0,0 +1,26 @@
+"""Pytest configuration for property tests."""
+import asyncio
+import os
+
+import pytest
+from hypothesis import settings
+
+try:
+    import uvloop
+except ImportError:  # Not installed on Windows, where uvicorn[standard] omits it
+    uvloop = None
+
+# A quick inner-loop profile, picked with HYPOTHESIS_PROFILE=fast. Tests cap
+# their own max_examples at the active profile's, so it bounds them all
+settings.register_profile("fast", max_examples=3, deadline=None)
+
+if "HYPOTHESIS_PROFILE" in os.environ:
+    settings.load_profile(os.environ["HYPOTHESIS_PROFILE"])
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run property tests on uvloop when it's installed."""
+    if uvloop is None:
+        return asyncio.get_event_loop_policy()
+    return uvloop.EventLoopPolicy()
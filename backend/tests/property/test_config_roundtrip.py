@@ -15,14 +15,31 @@ Test Strategy:
 5. Verify imported configurations match originals
 """
 
+from contextlib import asynccontextmanager
+from operator import itemgetter
+
 import pytest
-from hypothesis import given, settings, strategies as st
-from sqlalchemy.ext.asyncio import AsyncSession
+from hypothesis import HealthCheck, Phase, given, settings, strategies as st
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
+from app.core.exceptions import ValidationError
 from app.models.config import MCPServerConfig, ModelConfig
 from app.services.mcp_config_manager import MCPConfigManager
 from app.services.model_config_manager import ModelConfigManager
 
+# Keep this module on one xdist worker alongside its compiled schema DDL
+pytestmark = pytest.mark.xdist_group("config_roundtrip")
+
+# Printable ASCII only: full-Unicode text is far slower to generate and shrink,
+# and these fields are identifiers and commands rather than prose
+_ASCII = st.characters(min_codepoint=32, max_codepoint=126, blacklist_characters='"\\\x00')
+
+# Keys of exported configurations
+_LABEL = itemgetter("label")
+_NAME = itemgetter("name")
+
 
 # Strategy for generating model configurations
 @st.composite
@@ -31,8 +48,8 @@ def model_config_strategy(draw):
     provider = draw(
         st.sampled_from(["anthropic", "openai", "doubao", "qianwen", "kimi", "local"])
     )
-    label = draw(st.text(min_size=1, max_size=50, alphabet=st.characters(blacklist_characters="\x00")))
-    model_name = draw(st.text(min_size=1, max_size=100, alphabet=st.characters(blacklist_characters="\x00")))
+    label = draw(st.text(min_size=1, max_size=50, alphabet=_ASCII))
+    model_name = draw(st.text(min_size=1, max_size=100, alphabet=_ASCII))
 
     return {
         "provider": provider,
@@ -52,7 +69,7 @@ def model_config_strategy(draw):
 def mcp_server_config_strategy(draw):
     """Generate valid MCP server configuration data."""
     protocol = draw(st.sampled_from(["stdio", "http", "ws"]))
-    name = draw(st.text(min_size=1, max_size=50, alphabet=st.characters(blacklist_characters="\x00")))
+    name = draw(st.text(min_size=1, max_size=50, alphabet=_ASCII))
 
     config = {
         "name": name,
@@ -62,23 +79,84 @@ def mcp_server_config_strategy(draw):
     }
 
     if protocol == "stdio":
-        config["command"] = draw(st.text(min_size=1, max_size=50))
-        config["args"] = draw(st.lists(st.text(min_size=1, max_size=20), max_size=5))
+        config["command"] = draw(st.text(min_size=1, max_size=50, alphabet=_ASCII))
+        config["args"] = draw(st.lists(st.text(min_size=1, max_size=20, alphabet=_ASCII), max_size=5))
     else:
-        config["endpoint"] = f"https://example.com/mcp/{draw(st.text(min_size=1, max_size=20))}"
+        config["endpoint"] = f"https://example.com/mcp/{draw(st.text(min_size=1, max_size=20, alphabet=_ASCII))}"
         config["auth_type"] = draw(st.sampled_from(["none", "api_key", "oauth"]))
 
     return config
 
 
+@pytest.fixture
+async def async_db_session(create_schema) -> AsyncSession:
+    """Create an async session whose writes are rolled back after the test.
+
+    The session joins an outer transaction in "create_savepoint" mode, so the
+    managers' own commits only release SAVEPOINTs.
+    """
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool, echo=False)
+
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs behave under pysqlite
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await create_schema(conn)
+
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+        yield session
+
+        await session.close()
+        await trans.rollback()
+
+    await engine.dispose()
+
+
+@asynccontextmanager
+async def example_savepoint(session: AsyncSession):
+    """Roll back everything a single Hypothesis example wrote.
+
+    Replaces deleting rows and committing between examples with one
+    SAVEPOINT rollback on the session's connection.
+    """
+    savepoint = await session.bind.begin_nested()
+    try:
+        yield
+    finally:
+        await session.rollback()
+        await savepoint.rollback()
+        session.expunge_all()
+
+
 class TestConfigRoundtripConsistency:
     """Property tests for configuration roundtrip consistency."""
 
     @pytest.mark.asyncio
     @given(configs=st.lists(model_config_strategy(), min_size=1, max_size=5))
-    @settings(max_examples=10, deadline=5000)
+    @settings(
+        max_examples=min(50, settings.default.max_examples),
+        # Per-example time is dominated by DB round trips, not the property itself
+        deadline=None,
+        # Examples share the fixture but are isolated by example_savepoint
+        suppress_health_check=[HealthCheck.function_scoped_fixture, HealthCheck.too_slow],
+        # Skip shrinking; failing examples are small already and still replay
+        phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.target],
+    )
     async def test_model_config_roundtrip(
-        self, configs, db_session: AsyncSession
+        self, configs, async_db_session: AsyncSession
     ):
         """
         Property: Model configurations can be exported and re-imported without data loss.
@@ -87,61 +165,75 @@ class TestConfigRoundtripConsistency:
         When: Export configurations, delete originals, then import
         Then: Imported configurations match original configurations
         """
-        manager = ModelConfigManager(db_session)
+        async with example_savepoint(async_db_session):
+            manager = ModelConfigManager(async_db_session)
 
-        # Step 1: Create initial configurations
-        created_configs = []
-        for config_data in configs:
+            # Step 1: Create initial configurations
             try:
-                config = await manager.save_configuration(**config_data)
-                created_configs.append(config)
-            except Exception as e:
-                # Skip invalid configs
-                continue
-
-        if not created_configs:
-            pytest.skip("No valid configurations created")
-
-        # Step 2: Export configurations
-        exported_data = await manager.export_configurations()
-
-        assert "models" in exported_data
-        assert len(exported_data["models"]) == len(created_configs)
-
-        # Verify export contains all data
-        exported_labels = {m["label"] for m in exported_data["models"]}
-        original_labels = {c.label for c in created_configs}
-        assert exported_labels == original_labels
-
-        # Step 3: Delete original configurations
-        for config in created_configs:
-            if not config.is_default:  # Can't delete default
-                await manager.delete_configuration(config.id)
-
-        # Step 4: Import configurations
-        imported_configs = await manager.import_configurations(
-            exported_data, overwrite=True
-        )
+                created_configs = await manager.save_configurations_bulk(configs)
+            except ValidationError:
+                created_configs = []
+
+            if not created_configs:
+                pytest.skip("No valid configurations created")
 
-        assert len(imported_configs) > 0
+            # Step 2: Export configurations
+            exported_data = await manager.export_configurations()
 
-        # Step 5: Verify imported configurations match originals
-        for imported in imported_configs:
-            # Find matching original
-            original = next((c for c in created_configs if c.label == imported.label), None)
-            assert original is not None, f"Imported config {imported.label} has no matching original"
+            assert "models" in exported_data
+            assert len(exported_data["models"]) == len(created_configs)
 
-            # Verify key properties match
-            assert imported.provider == original.provider
-            assert imported.model_name == original.model_name
-            assert imported.is_default == original.is_default
-            assert imported.capabilities == original.capabilities
+            # Verify export contains all data
+            exported_labels = set(map(_LABEL, exported_data["models"]))
+            original_labels = {c.label for c in created_configs}
+            assert exported_labels == original_labels
+
+            # Step 3: Delete original configurations
+            for config in created_configs:
+                if not config.is_default:  # Can't delete default
+                    await manager.delete_configuration(config.id)
+
+            # Step 4: Import configurations
+            imported_configs = await manager.import_configurations(
+                exported_data, overwrite=True
+            )
+
+            assert len(imported_configs) > 0
+
+            # Step 5: Verify imported configurations match originals
+            originals_by_label = {c.label: c for c in created_configs}
+            for imported in imported_configs:
+                # Find matching original
+                original = originals_by_label.get(imported.label)
+                assert original is not None, f"Imported config {imported.label} has no matching original"
+
+                # Verify key properties match
+                assert imported.provider == original.provider
+                assert imported.model_name == original.model_name
+                assert imported.is_default == original.is_default
+                assert imported.capabilities == original.capabilities
 
     @pytest.mark.asyncio
-    @given(configs=st.lists(mcp_server_config_strategy(), min_size=1, max_size=5))
-    @settings(max_examples=10, deadline=5000)
+    @given(
+        configs=st.lists(
+            mcp_server_config_strategy(),
+            min_size=1,
+            max_size=5,
+            # Names are unique in the table, so duplicates would fail the batch
+            unique_by=lambda config: config["name"],
+        )
+    )
+    @settings(
+        max_examples=min(50, settings.default.max_examples),
+        # Per-example time is dominated by DB round trips, not the property itself
+        deadline=None,
+        # Examples share the fixture but are isolated by example_savepoint
+        suppress_health_check=[HealthCheck.function_scoped_fixture, HealthCheck.too_slow],
+        # Skip shrinking; failing examples are small already and still replay
+        phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.target],
+    )
     async def test_mcp_config_roundtrip(
-        self, configs, db_session: AsyncSession
+        self, configs, async_db_session: AsyncSession
     ):
         """
         Property: MCP server configurations can be exported and re-imported without data loss.
@@ -150,65 +242,64 @@ class TestConfigRoundtripConsistency:
         When: Export configurations, delete originals, then import
         Then: Imported configurations match original configurations
         """
-        manager = MCPConfigManager(db_session)
+        async with example_savepoint(async_db_session):
+            manager = MCPConfigManager(async_db_session)
 
-        # Step 1: Create initial configurations
-        created_configs = []
-        for config_data in configs:
+            # Step 1: Create initial configurations
             try:
-                config = MCPServerConfig(**config_data)
-                saved_config = await manager.save_configuration(config, connect=False)
-                created_configs.append(saved_config)
-            except Exception as e:
-                # Skip invalid configs
-                continue
-
-        if not created_configs:
-            pytest.skip("No valid configurations created")
-
-        # Step 2: Export configurations
-        exported_data = await manager.export_configurations()
-
-        assert "servers" in exported_data
-        assert len(exported_data["servers"]) == len(created_configs)
-
-        # Verify export contains all data
-        exported_names = {s["name"] for s in exported_data["servers"]}
-        original_names = {c.name for c in created_configs}
-        assert exported_names == original_names
-
-        # Step 3: Delete original configurations
-        for config in created_configs:
-            await manager.delete_configuration(config.id, disconnect=True)
-
-        # Step 4: Import configurations
-        imported_configs = await manager.import_configurations(
-            exported_data, overwrite=True
-        )
-
-        assert len(imported_configs) > 0
-
-        # Step 5: Verify imported configurations match originals
-        for imported in imported_configs:
-            # Find matching original
-            original = next((c for c in created_configs if c.name == imported.name), None)
-            assert original is not None, f"Imported config {imported.name} has no matching original"
-
-            # Verify key properties match
-            assert imported.protocol == original.protocol
-            assert imported.auto_reconnect == original.auto_reconnect
-            assert imported.retry_policy == original.retry_policy
-
-            if original.protocol == "stdio":
-                assert imported.command == original.command
-                assert imported.args == original.args
-            else:
-                assert imported.endpoint == original.endpoint
-                assert imported.auth_type == original.auth_type
+                created_configs = await manager.save_configurations_bulk(
+                    [MCPServerConfig(**config_data) for config_data in configs]
+                )
+            except ValidationError:
+                created_configs = []
+
+            if not created_configs:
+                pytest.skip("No valid configurations created")
+
+            # Step 2: Export configurations
+            exported_data = await manager.export_configurations()
+
+            assert "servers" in exported_data
+            assert len(exported_data["servers"]) == len(created_configs)
+
+            # Verify export contains all data
+            exported_names = set(map(_NAME, exported_data["servers"]))
+            original_names = {c.name for c in created_configs}
+            assert exported_names == original_names
+
+            # Step 3: Delete original configurations
+            for config in created_configs:
+                await manager.delete_configuration(config.id, disconnect=True)
+
+            # Step 4: Import configurations
+            imported_configs = await manager.import_configurations(
+                exported_data, overwrite=True
+            )
+
+            assert len(imported_configs) > 0
+
+            # Step 5: Verify imported configurations match originals
+            originals_by_name = {c.name: c for c in created_configs}
+            for imported in imported_configs:
+                # Find matching original
+                original = originals_by_name.get(imported.name)
+                assert original is not None, f"Imported config {imported.name} has no matching original"
+
+                # Verify key properties match
+                assert imported.protocol == original.protocol
+                assert imported.auto_reconnect == original.auto_reconnect
+                assert imported.retry_policy == original.retry_policy
+
+                if original.protocol == "stdio":
+                    assert imported.command == original.command
+                    assert imported.args == original.args
+                else:
+                    assert imported.endpoint == original.endpoint
+                    assert imported.auth_type == original.auth_type
 
     @pytest.mark.asyncio
     async def test_complete_system_config_roundtrip(
-        self, db_session: AsyncSession
+        self, async_db_session: AsyncSession
     ):
         """
         Test: Complete system configuration can be exported and restored.
@@ -216,27 +307,32 @@ class TestConfigRoundtripConsistency:
         This test verifies that the entire system configuration (models and MCP servers)
         can be exported, the system can be reset, and then restored to the same state.
         """
+        # Both managers share one AsyncSession, which doesn't allow concurrent
+        # operations, so the steps below must stay sequential rather than gathered
+
         # Create model configurations
-        model_manager = ModelConfigManager(db_session)
-        model_configs = [
-            await model_manager.save_configuration(
-                provider="anthropic",
-                label="Test Claude",
-                model_name="claude-3-5-sonnet-20241022",
-                is_default=True,
-            ),
-            await model_manager.save_configuration(
-                provider="openai",
-                label="Test GPT-4",
-                model_name="gpt-4",
-                is_default=False,
-            ),
-        ]
+        model_manager = ModelConfigManager(async_db_session)
+        model_configs = await model_manager.save_configurations_bulk(
+            [
+                {
+                    "provider": "anthropic",
+                    "label": "Test Claude",
+                    "model_name": "claude-3-5-sonnet-20241022",
+                    "is_default": True,
+                },
+                {
+                    "provider": "openai",
+                    "label": "Test GPT-4",
+                    "model_name": "gpt-4",
+                    "is_default": False,
+                },
+            ]
+        )
 
         # Create MCP configurations
-        mcp_manager = MCPConfigManager(db_session)
-        mcp_configs = [
-            await mcp_manager.save_configuration(
+        mcp_manager = MCPConfigManager(async_db_session)
+        mcp_configs = await mcp_manager.save_configurations_bulk(
+            [
                 MCPServerConfig(
                     name="test-server-1",
                     protocol="stdio",
@@ -244,9 +340,6 @@ class TestConfigRoundtripConsistency:
                     args=["-y", "@test/server"],
                     auto_reconnect=True,
                 ),
-                connect=False,
-            ),
-            await mcp_manager.save_configuration(
                 MCPServerConfig(
                     name="test-server-2",
                     protocol="http",
@@ -254,9 +347,8 @@ class TestConfigRoundtripConsistency:
                     auth_type="none",
                     auto_reconnect=False,
                 ),
-                connect=False,
-            ),
-        ]
+            ]
+        )
 
         # Export all configurations
         model_export = await model_manager.export_configurations()
@@ -288,26 +380,29 @@ class TestConfigRoundtripConsistency:
         assert len(imported_mcp) == 2
 
         # Verify specific properties
-        test_claude = next((m for m in imported_models if m.label == "Test Claude"), None)
+        models_by_label = {m.label: m for m in imported_models}
+        servers_by_name = {s.name: s for s in imported_mcp}
+
+        test_claude = models_by_label.get("Test Claude")
         assert test_claude is not None
         assert test_claude.is_default is True
         assert test_claude.provider == "anthropic"
 
-        test_server_1 = next((s for s in imported_mcp if s.name == "test-server-1"), None)
+        test_server_1 = servers_by_name.get("test-server-1")
         assert test_server_1 is not None
         assert test_server_1.protocol == "stdio"
         assert test_server_1.command == "npx"
 
     @pytest.mark.asyncio
     async def test_config_export_excludes_sensitive_data_by_default(
-        self, db_session: AsyncSession
+        self, async_db_session: AsyncSession
     ):
         """
         Test: Configuration export excludes sensitive data (API keys) by default.
 
         This verifies requirement 23.2: Sensitive information handling.
         """
-        manager = ModelConfigManager(db_session)
+        manager = ModelConfigManager(async_db_session)
 
         # Create configuration with API key
         config = await manager.save_configuration(
@@ -337,14 +432,14 @@ class TestConfigRoundtripConsistency:
 
     @pytest.mark.asyncio
     async def test_config_import_handles_duplicate_names(
-        self, db_session: AsyncSession
+        self, async_db_session: AsyncSession
     ):
         """
         Test: Configuration import handles duplicate names correctly.
 
         This verifies requirement 23.5: Selective import.
         """
-        manager = ModelConfigManager(db_session)
+        manager = ModelConfigManager(async_db_session)
 
         # Create original configuration
         original = await manager.save_configuration(
@@ -383,7 +478,7 @@ class TestConfigRoundtripConsistency:
         assert len(imported_no_overwrite) == 0
 
         # Verify original unchanged
-        await db_session.refresh(original)
+        await async_db_session.refresh(original)
         assert original.model_name == "claude-3-sonnet-20240229"
 
         # Import with overwrite - should update
@@ -396,3 +491,70 @@ class TestConfigRoundtripConsistency:
         updated = imported_with_overwrite[0]
         assert updated.label == "Test Model"
         assert updated.model_name == "claude-3-5-sonnet-20241022"
+        # Server-side columns refreshed by the update are loaded, not left expired
+        assert updated.updated_at is not None
+
+    @pytest.mark.asyncio
+    async def test_saved_and_imported_configs_readable_after_commit(
+        self, async_db_session: AsyncSession
+    ):
+        """
+        Test: Saved and imported configurations stay readable after their commit.
+
+        Uses a session with SQLAlchemy's default expire_on_commit=True, so any
+        attribute left expired by the commit would need a lazy load.
+        """
+        async with AsyncSession(
+            bind=async_db_session.bind, join_transaction_mode="create_savepoint"
+        ) as session:
+            manager = ModelConfigManager(session)
+
+            saved = await manager.save_configurations_bulk(
+                [{"provider": "anthropic", "label": "Saved", "model_name": "claude-a"}]
+            )
+            assert saved[0].label == "Saved"
+            assert saved[0].updated_at is not None
+
+            imported = await manager.import_configurations(
+                {
+                    "models": [
+                        {"provider": "anthropic", "label": "Saved", "model_name": "claude-b"},
+                        {"provider": "openai", "label": "New", "model_name": "gpt-4"},
+                    ]
+                },
+                overwrite=True,
+            )
+
+            assert [(c.label, c.model_name) for c in imported] == [
+                ("Saved", "claude-b"),
+                ("New", "gpt-4"),
+            ]
+            assert all(c.updated_at is not None for c in imported)
+
+    @pytest.mark.asyncio
+    async def test_saved_mcp_configs_readable_after_commit(
+        self, async_db_session: AsyncSession
+    ):
+        """
+        Test: Bulk-saved MCP configurations stay readable after their commit.
+
+        Uses a session with SQLAlchemy's default expire_on_commit=True, so any
+        attribute left expired by the commit would need a lazy load.
+        """
+        async with AsyncSession(
+            bind=async_db_session.bind, join_transaction_mode="create_savepoint"
+        ) as session:
+            manager = MCPConfigManager(session)
+
+            saved = await manager.save_configurations_bulk(
+                [
+                    MCPServerConfig(name="server-b", protocol="stdio", command="npx"),
+                    MCPServerConfig(name="server-a", protocol="stdio", command="uvx"),
+                ]
+            )
+
+            assert [(c.name, c.command) for c in saved] == [
+                ("server-b", "npx"),
+                ("server-a", "uvx"),
+            ]
+            assert all(c.updated_at is not None for c in saved)
@@ -2,48 +2,92 @@
 
 Verifies requirement 2.2.
 """
-import tempfile
+import asyncio
+from uuid import uuid4
 
 import pytest
-from hypothesis import given, settings
+import pytest_asyncio
+from hypothesis import HealthCheck, example, given, settings
 from hypothesis import strategies as st
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
-from app.db.base import Base
 from app.services.file_system_manager import FileSystemManager
 
+# Run every test and async fixture on one session-wide loop, so the
+# session-scoped engine stays usable across tests
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture
-async def test_db():
-    """Create a test database."""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+# Buffers built once at import and reused by every test and example; bytes so
+# writes and reads skip UTF-8 encoding and decoding
+_LARGE_CONTENT = b"x" * (FileSystemManager.CONTEXT_THRESHOLD + 1000)
+_CHUNK = b"x" * (FileSystemManager.CONTEXT_THRESHOLD // 2)
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
 
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_engine(create_test_schema):
+    """Create the test database engine and schema once per session."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool, echo=False)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs behave under pysqlite
+        dbapi_connection.isolation_level = None
+
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-20000")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await create_test_schema(conn)
 
-    async with async_session() as session:
-        yield session
+    yield engine
 
     await engine.dispose()
 
 
-@pytest.fixture
-async def file_system_manager(test_db):
-    """Create a file system manager for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        manager = FileSystemManager(
-            workspace_id="test-workspace",
-            base_path=tmpdir,
-            session=test_db,
+@pytest.fixture(scope="session")
+def files_dir(tmp_path_factory):
+    """Create one base directory shared by all file system managers."""
+    return tmp_path_factory.mktemp("files")
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def test_db(shared_engine):
+    """Create a test session rolled back after each test."""
+    async with shared_engine.connect() as conn:
+        trans = await conn.begin()
+
+        session_factory = async_sessionmaker(
+            bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
         )
-        yield manager
+        async with session_factory() as session:
+            yield session
+
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def file_system_manager(test_db, files_dir):
+    """Create a file system manager in its own workspace directory."""
+    return FileSystemManager(
+        workspace_id=f"ws-{uuid4().hex}",
+        base_path=str(files_dir),
+        session=test_db,
+    )
 
 
 # Property 3: Context size management
-@settings(max_examples=50)
+# The threshold check is monotone, so a few examples plus the boundaries suffice
+@settings(max_examples=min(10, settings.default.max_examples))
+@example(content_size=FileSystemManager.CONTEXT_THRESHOLD + 1)
 @given(
     # Generate content that exceeds the threshold
     content_size=st.integers(
@@ -51,11 +95,7 @@ async def file_system_manager(test_db):
         max_value=FileSystemManager.CONTEXT_THRESHOLD * 3,
     ),
 )
-@pytest.mark.asyncio
-async def test_large_content_externalization(
-    file_system_manager: FileSystemManager,
-    content_size: int,
-):
+def test_large_content_externalization(content_size: int):
     """
     Test that large content is identified for externalization.
 
@@ -63,16 +103,15 @@ async def test_large_content_externalization(
     - Content exceeding threshold is detected (Req 2.2)
     - System can handle large content appropriately
     """
-    # Generate large content
-    content = "a" * content_size
-
-    # Check if content should be externalized
-    should_externalize = await file_system_manager.should_externalize_content(content)
+    # Check by length so no large string has to be built
+    should_externalize = FileSystemManager.should_externalize_size(content_size)
 
     assert should_externalize, f"Content of size {content_size} should be externalized"
 
 
-@settings(max_examples=50)
+@settings(max_examples=min(10, settings.default.max_examples))
+@example(content_size=1)
+@example(content_size=FileSystemManager.CONTEXT_THRESHOLD)
 @given(
     # Generate content below threshold
     content_size=st.integers(
@@ -80,26 +119,19 @@ async def test_large_content_externalization(
         max_value=FileSystemManager.CONTEXT_THRESHOLD,
     ),
 )
-@pytest.mark.asyncio
-async def test_small_content_not_externalized(
-    file_system_manager: FileSystemManager,
-    content_size: int,
-):
+def test_small_content_not_externalized(content_size: int):
     """Test that small content is not externalized."""
-    content = "a" * content_size
-
-    should_externalize = await file_system_manager.should_externalize_content(content)
+    should_externalize = FileSystemManager.should_externalize_size(content_size)
 
     assert not should_externalize, f"Content of size {content_size} should not be externalized"
 
 
-@pytest.mark.asyncio
 async def test_large_content_written_to_file(
     file_system_manager: FileSystemManager,
 ):
     """Test that large content can be written to and read from file."""
-    # Generate content larger than threshold
-    large_content = "x" * (FileSystemManager.CONTEXT_THRESHOLD + 1000)
+    # Content larger than threshold
+    large_content = _LARGE_CONTENT
 
     path = "test/large_file.txt"
 
@@ -111,41 +143,49 @@ async def test_large_content_written_to_file(
     assert file_record.size > FileSystemManager.CONTEXT_THRESHOLD
 
     # Read content back
-    read_content = await file_system_manager.read_file(path)
+    read_content = await file_system_manager.read_bytes(path)
 
     # Verify content is preserved
     assert read_content == large_content
     assert len(read_content) > FileSystemManager.CONTEXT_THRESHOLD
 
 
-@settings(max_examples=20)
+@settings(
+    max_examples=min(20, settings.default.max_examples),
+    # Examples share one manager; each writes under its own directory
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
 @given(
     num_chunks=st.integers(min_value=2, max_value=10),
 )
-@pytest.mark.asyncio
 async def test_incremental_content_growth(
     file_system_manager: FileSystemManager,
     num_chunks: int,
 ):
     """Test content that grows incrementally beyond threshold."""
-    chunk_size = FileSystemManager.CONTEXT_THRESHOLD // 2
-    path = "test/growing_file.txt"
-
-    content = ""
+    example_dir = uuid4().hex
+    snapshots = []
+    content = b""
     for i in range(num_chunks):
-        chunk = f"Chunk {i}: " + ("x" * chunk_size)
+        chunk = f"Chunk {i}: ".encode() + _CHUNK
         content += chunk
 
-        await file_system_manager.write_file(path, content)
+        # Writes share the manager's session, so they stay sequential; each
+        # snapshot gets its own path so all of them can be verified at the end
+        await file_system_manager.write_file(f"{example_dir}/growing_{i}.txt", content)
+        snapshots.append(content)
 
+    for i, snapshot in enumerate(snapshots):
         # Check if should be externalized
-        should_externalize = await file_system_manager.should_externalize_content(content)
+        should_externalize = FileSystemManager.should_externalize_size(len(snapshot))
 
-        if len(content) > FileSystemManager.CONTEXT_THRESHOLD:
+        if len(snapshot) > FileSystemManager.CONTEXT_THRESHOLD:
             assert should_externalize, f"Content should be externalized after {i+1} chunks"
         else:
             assert not should_externalize, f"Content should not be externalized after {i+1} chunks"
 
-        # Verify content is preserved
-        read_content = await file_system_manager.read_file(path)
-        assert read_content == content
+    # Verify content is preserved
+    read_contents = await asyncio.gather(
+        *(file_system_manager.read_bytes(f"{example_dir}/growing_{i}.txt") for i in range(num_chunks))
+    )
+    assert read_contents == snapshots
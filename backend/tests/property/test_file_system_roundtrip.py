@@ -4,38 +4,102 @@ Verifies requirements 2.1, 2.3.
 """
 import tempfile
 from pathlib import Path
+from uuid import uuid4
 
 import pytest
-from hypothesis import given, settings
+import pytest_asyncio
+from hypothesis import HealthCheck, given, settings
 from hypothesis import strategies as st
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from app.db.base import Base
 from app.services.file_system_manager import FileSystemManager
 
+# Run every test and async fixture on one session-wide loop, so the
+# session-scoped database session stays usable across tests
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Strategies built once at import rather than inside each @given
+_ROUNDTRIP_TEXT = st.text(
+    alphabet=st.characters(
+        blacklist_categories=("Cs",),  # Exclude surrogate characters
+        blacklist_characters=("\x00",),  # Exclude null bytes
+    ),
+    min_size=1,
+    max_size=10000,
+)
+_ALPHA_FILENAME = st.text(
+    alphabet=st.characters(
+        whitelist_categories=("L", "N"),  # Letters and numbers
+    ),
+    min_size=1,
+    max_size=50,
+).map(lambda s: f"{s}.txt")
+
+
+def _example_path(filename: str) -> str:
+    """Place an example's file in its own directory, apart from earlier examples' files."""
+    return f"{uuid4().hex}/{filename}"
+
 
 # Database setup for tests
-@pytest.fixture
-async def test_db():
-    """Create a test database."""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_session(create_test_schema):
+    """Create one database and session reused by every test."""
     # Use in-memory SQLite for testing
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool, echo=False)
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    @event.listens_for(engine.sync_engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs behave under pysqlite
+        dbapi_connection.isolation_level = None
+
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-20000")
+        cursor.close()
 
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await create_test_schema(conn)
+
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        # The manager's commits only release savepoints inside this transaction
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
 
-    async with async_session() as session:
         yield session
 
+        await session.close()
+        await trans.rollback()
+
     await engine.dispose()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
+async def test_db(shared_session):
+    """Yield the shared session, rolling back the test's writes afterwards."""
+    savepoint = await shared_session.bind.begin_nested()
+    try:
+        yield shared_session
+    finally:
+        await shared_session.rollback()
+        await savepoint.rollback()
+        shared_session.expunge_all()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
 async def file_system_manager(test_db):
-    """Create a file system manager for testing."""
+    """Create a file system manager for testing, reused by every Hypothesis example."""
     with tempfile.TemporaryDirectory() as tmpdir:
         manager = FileSystemManager(
             workspace_id="test-workspace",
@@ -46,25 +110,15 @@ async def file_system_manager(test_db):
 
 
 # Property 2: File system roundtrip consistency
-@settings(max_examples=100)
+@settings(
+    max_examples=min(100, settings.default.max_examples),
+    # Examples share one manager; each writes under its own path
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
 @given(
-    content=st.text(
-        alphabet=st.characters(
-            blacklist_categories=("Cs",),  # Exclude surrogate characters
-            blacklist_characters=("\x00",),  # Exclude null bytes
-        ),
-        min_size=1,
-        max_size=10000,
-    ),
-    filename=st.text(
-        alphabet=st.characters(
-            whitelist_categories=("L", "N"),  # Letters and numbers
-        ),
-        min_size=1,
-        max_size=50,
-    ).map(lambda s: f"{s}.txt"),
+    content=_ROUNDTRIP_TEXT,
+    filename=_ALPHA_FILENAME,
 )
-@pytest.mark.asyncio
 async def test_file_roundtrip_consistency(
     file_system_manager: FileSystemManager,
     content: str,
@@ -79,7 +133,7 @@ async def test_file_roundtrip_consistency(
     - Content is preserved through roundtrip
     """
     # Write content
-    path = f"test/{filename}"
+    path = _example_path(filename)
     await file_system_manager.write_file(path, content)
 
     # Read content back
@@ -89,7 +143,11 @@ async def test_file_roundtrip_consistency(
     assert read_content == content, "Content should be identical after roundtrip"
 
 
-@settings(max_examples=50)
+@settings(
+    max_examples=min(50, settings.default.max_examples),
+    # Examples share one manager; each writes under its own path
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
 @given(
     content=st.text(min_size=1, max_size=5000),
     # Test various encodings and special characters
@@ -101,7 +159,6 @@ async def test_file_roundtrip_consistency(
         st.just("Backslash: \\path\\to\\file"),  # Backslashes
     ),
 )
-@pytest.mark.asyncio
 async def test_special_characters_roundtrip(
     file_system_manager: FileSystemManager,
     content: str,
@@ -110,7 +167,7 @@ async def test_special_characters_roundtrip(
     """Test roundtrip with special characters and encodings."""
     combined_content = content + "\n" + special_content
 
-    path = "test/special.txt"
+    path = _example_path("special.txt")
     await file_system_manager.write_file(path, combined_content)
 
     read_content = await file_system_manager.read_file(path)
@@ -118,7 +175,11 @@ async def test_special_characters_roundtrip(
     assert read_content == combined_content
 
 
-@settings(max_examples=20)
+@settings(
+    max_examples=min(20, settings.default.max_examples),
+    # Examples share one manager; each writes under its own path
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
 @given(
     updates=st.lists(
         st.text(min_size=1, max_size=1000),
@@ -126,13 +187,12 @@ async def test_special_characters_roundtrip(
         max_size=10,
     ),
 )
-@pytest.mark.asyncio
 async def test_multiple_updates_consistency(
     file_system_manager: FileSystemManager,
     updates: list,
 ):
     """Test that multiple updates preserve consistency."""
-    path = "test/updates.txt"
+    path = _example_path("updates.txt")
 
     for content in updates:
         await file_system_manager.write_file(path, content)
@@ -8,8 +8,8 @@ Validates Requirement 5.2: MCP tool conversion
 """
 
 import asyncio
-from typing import Any, Dict
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
 
 import pytest
 from hypothesis import given, settings
@@ -18,6 +18,13 @@ from langchain_core.tools import BaseTool, StructuredTool
 
 from app.services.mcp_adapter import MCPAdapter
 
+# Strategies built once at import rather than inside each @given
+_LETTERS = st.characters(whitelist_categories=("Lu", "Ll"))
+_ALPHA_NAME = st.text(min_size=1, max_size=20, alphabet=_LETTERS)
+
+# Argument types whose formatted output MockMCPTool.call can safely memoise
+_CACHEABLE_TYPES = (int, str)
+
 
 class MockMCPTool:
     """Mock MCP tool for testing."""
@@ -34,6 +41,7 @@ class MockMCPTool:
         self.name = name
         self.description = description
         self.parameters = parameters
+        self._results: Dict[Tuple[Tuple[str, Any], ...], str] = {}
 
     async def call(self, **kwargs: Any) -> str:
         """
@@ -46,21 +54,81 @@ class MockMCPTool:
             Simulated tool output
         """
         # Simple deterministic output based on inputs
-        return f"Result for {self.name}: {str(sorted(kwargs.items()))}"
+        key = tuple(sorted(kwargs.items()))
 
+        # Equal floats can format differently (0.0 and -0.0), so only reuse
+        # results for values whose equality implies identical output
+        if not all(type(value) in _CACHEABLE_TYPES for _, value in key):
+            return f"Result for {self.name}: {list(key)}"
 
-def create_mock_session() -> AsyncMock:
-    """
-    Create a mock MCP session.
+        result = self._results.get(key)
+        if result is None:
+            result = self._results[key] = f"Result for {self.name}: {list(key)}"
+        return result
+
+
+class _StubTransport:
+    """stdio_client stand-in that opens placeholder read/write streams."""
+
+    async def __aenter__(self) -> Tuple[None, None]:
+        return None, None
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class _StubSession:
+    """ClientSession stand-in that connects and initializes without I/O."""
+
+    def __init__(self, read: Any, write: Any):
+        self.read = read
+        self.write = write
+
+    async def __aenter__(self) -> "_StubSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    async def initialize(self) -> None:
+        return None
 
-    Returns:
-        Mock session object
-    """
-    session = AsyncMock()
-    session.__aenter__ = AsyncMock(return_value=session)
-    session.__aexit__ = AsyncMock(return_value=None)
-    session.initialize = AsyncMock()
-    return session
+
+class _StubToolkit:
+    """MCPToolkit stand-in serving a fixed list of tools."""
+
+    def __init__(self, tools: List[Any]):
+        self.tools = tools
+
+    def get_tools(self) -> List[Any]:
+        return self.tools
+
+
+@pytest.fixture
+def mcp_transport(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace the MCP stdio transport and client session with plain stubs."""
+    monkeypatch.setattr(
+        "app.services.mcp_adapter.stdio_client", lambda *args, **kwargs: _StubTransport()
+    )
+    monkeypatch.setattr("app.services.mcp_adapter.ClientSession", _StubSession)
+
+
+class SimpleTool(BaseTool):
+    """LangChain tool forwarding calls to a mock MCP tool, without a schema."""
+
+    mcp_tool: Any
+
+    async def _arun(self, **kwargs: Any) -> str:
+        return await self.mcp_tool.call(**kwargs)
+
+    def _run(self, **kwargs: Any) -> str:
+        # Sync invocations run outside any event loop, so give the call its own
+        return asyncio.run(self.mcp_tool.call(**kwargs))
+
+
+# Converted tools keyed by (name, description); a MockMCPTool's output depends
+# only on its name, so same-named tools are interchangeable across examples
+_CONVERTED_TOOLS: Dict[Tuple[str, str], BaseTool] = {}
 
 
 def create_mock_langchain_tool(mcp_tool: MockMCPTool) -> BaseTool:
@@ -73,43 +141,21 @@ def create_mock_langchain_tool(mcp_tool: MockMCPTool) -> BaseTool:
     Returns:
         LangChain-compatible tool
     """
+    key = (mcp_tool.name, mcp_tool.description)
+    tool = _CONVERTED_TOOLS.get(key)
+    if tool is None:
+        tool = SimpleTool(name=mcp_tool.name, description=mcp_tool.description, mcp_tool=mcp_tool)
+        _CONVERTED_TOOLS[key] = tool
 
-    async def tool_func(input_data: str = "") -> str:
-        # Parse input as dict if possible
-        try:
-            import json
-            if input_data:
-                data = json.loads(input_data) if isinstance(input_data, str) else input_data
-            else:
-                data = {}
-        except Exception:
-            data = {}
-
-        return await mcp_tool.call(**data)
-
-    # Create a simple tool without schema
-    from langchain_core.tools import BaseTool as CoreBaseTool
-
-    class SimpleTool(CoreBaseTool):
-        name: str = mcp_tool.name
-        description: str = mcp_tool.description
-
-        async def _arun(self, **kwargs: Any) -> str:
-            return await mcp_tool.call(**kwargs)
-
-        def _run(self, **kwargs: Any) -> str:
-            import asyncio
-            return asyncio.run(mcp_tool.call(**kwargs))
-
-    return SimpleTool()
+    return tool
 
 
 @pytest.mark.asyncio
 @given(
-    tool_name=st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=("Lu", "Ll"))),
+    tool_name=_ALPHA_NAME,
     param_value=st.integers(min_value=0, max_value=1000),
 )
-@settings(max_examples=100, deadline=5000)
+@settings(max_examples=min(100, settings.default.max_examples), deadline=5000)
 async def test_mcp_tool_conversion_equivalence(tool_name: str, param_value: int) -> None:
     """
     Property Test: MCP tool conversion preserves behavior.
@@ -150,7 +196,7 @@ async def test_mcp_tool_conversion_equivalence(tool_name: str, param_value: int)
     text_input=st.text(min_size=0, max_size=100),
     number_input=st.floats(min_value=-1000, max_value=1000, allow_nan=False, allow_infinity=False),
 )
-@settings(max_examples=100, deadline=5000)
+@settings(max_examples=min(100, settings.default.max_examples), deadline=5000)
 async def test_mcp_tool_multi_parameter_equivalence(
     text_input: str, number_input: float
 ) -> None:
@@ -188,7 +234,9 @@ async def test_mcp_tool_multi_parameter_equivalence(
 
 
 @pytest.mark.asyncio
-async def test_mcp_adapter_tool_conversion() -> None:
+async def test_mcp_adapter_tool_conversion(
+    mcp_transport: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """
     Integration test: MCPAdapter tool conversion.
 
@@ -197,53 +245,30 @@ async def test_mcp_adapter_tool_conversion() -> None:
     """
     adapter = MCPAdapter()
 
-    # Mock the stdio_client and session
-    with patch("app.services.mcp_adapter.stdio_client") as mock_stdio:
-        # Setup mock transport
-        mock_transport = AsyncMock()
-        mock_read = AsyncMock()
-        mock_write = AsyncMock()
-        mock_transport.__aenter__ = AsyncMock(return_value=(mock_read, mock_write))
-        mock_transport.__aexit__ = AsyncMock()
-        mock_stdio.return_value = mock_transport
-
-        # Setup mock session
-        with patch("app.services.mcp_adapter.ClientSession") as mock_session_class:
-            mock_session = create_mock_session()
-            mock_session_class.return_value = mock_session
-
-            # Setup mock toolkit
-            with patch("app.services.mcp_adapter.MCPToolkit") as mock_toolkit_class:
-                # Create mock tools
-                mock_tool1 = MagicMock(spec=BaseTool)
-                mock_tool1.name = "test_tool_1"
-                mock_tool1.description = "Test tool 1"
-
-                mock_tool2 = MagicMock(spec=BaseTool)
-                mock_tool2.name = "test_tool_2"
-                mock_tool2.description = "Test tool 2"
-
-                mock_toolkit = MagicMock()
-                mock_toolkit.get_tools.return_value = [mock_tool1, mock_tool2]
-                mock_toolkit_class.return_value = mock_toolkit
-
-                # Connect to server
-                await adapter.connect_server(
-                    server_name="test_server",
-                    command="test_command",
-                    args=["arg1"],
-                )
-
-                # Get tools
-                tools = await adapter.get_tools("test_server")
-
-                # Verify we got the tools
-                assert len(tools) == 2
-                assert tools[0].name == "test_tool_1"
-                assert tools[1].name == "test_tool_2"
-
-                # Cleanup
-                await adapter.disconnect_server("test_server")
+    # Create stub tools
+    tool1 = SimpleNamespace(name="test_tool_1", description="Test tool 1")
+    tool2 = SimpleNamespace(name="test_tool_2", description="Test tool 2")
+
+    toolkit = _StubToolkit([tool1, tool2])
+    monkeypatch.setattr("app.services.mcp_adapter.MCPToolkit", lambda session: toolkit)
+
+    # Connect to server
+    await adapter.connect_server(
+        server_name="test_server",
+        command="test_command",
+        args=["arg1"],
+    )
+
+    # Get tools
+    tools = await adapter.get_tools("test_server")
+
+    # Verify we got the tools
+    assert len(tools) == 2
+    assert tools[0].name == "test_tool_1"
+    assert tools[1].name == "test_tool_2"
+
+    # Cleanup
+    await adapter.disconnect_server("test_server")
 
 
 @pytest.mark.asyncio
@@ -276,10 +301,27 @@ async def test_tool_conversion_idempotence() -> None:
     assert tool1.description == tool2.description
 
 
+def test_tool_sync_call_equivalence() -> None:
+    """
+    Property Test: Sync calls on a converted tool match the MCP tool's output.
+
+    Tests that the synchronous path delegates to the wrapped tool.
+    """
+    mcp_tool = MockMCPTool(
+        name="sync_tool",
+        description="Tool to test sync calls",
+        parameters={"input": {"type": "string"}},
+    )
+
+    tool = create_mock_langchain_tool(mcp_tool)
+
+    assert tool._run(input="test_value") == asyncio.run(mcp_tool.call(input="test_value"))
+
+
 @pytest.mark.asyncio
 @given(
     input_data=st.dictionaries(
-        keys=st.text(min_size=1, max_size=10, alphabet=st.characters(whitelist_categories=("Lu", "Ll"))),
+        keys=st.text(min_size=1, max_size=10, alphabet=_LETTERS),
         values=st.one_of(
             st.integers(),
             st.text(max_size=50),
@@ -289,7 +331,7 @@ async def test_tool_conversion_idempotence() -> None:
         max_size=5,
     )
 )
-@settings(max_examples=50, deadline=5000)
+@settings(max_examples=min(50, settings.default.max_examples), deadline=5000)
 async def test_tool_conversion_with_complex_inputs(input_data: Dict[str, Any]) -> None:
     """
     Property Test: Tool conversion handles complex input types.
@@ -319,7 +361,9 @@ async def test_tool_conversion_with_complex_inputs(input_data: Dict[str, Any]) -
 
 
 @pytest.mark.asyncio
-async def test_multiple_server_tools_isolation() -> None:
+async def test_multiple_server_tools_isolation(
+    mcp_transport: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """
     Integration test: Tools from different servers are properly isolated.
 
@@ -327,56 +371,29 @@ async def test_multiple_server_tools_isolation() -> None:
     """
     adapter = MCPAdapter()
 
-    with patch("app.services.mcp_adapter.stdio_client") as mock_stdio:
-        mock_transport = AsyncMock()
-        mock_read = AsyncMock()
-        mock_write = AsyncMock()
-        mock_transport.__aenter__ = AsyncMock(return_value=(mock_read, mock_write))
-        mock_transport.__aexit__ = AsyncMock()
-        mock_stdio.return_value = mock_transport
-
-        with patch("app.services.mcp_adapter.ClientSession") as mock_session_class:
-            mock_session = create_mock_session()
-            mock_session_class.return_value = mock_session
-
-            with patch("app.services.mcp_adapter.MCPToolkit") as mock_toolkit_class:
-                # Setup first server tools
-                mock_tool_server1 = MagicMock(spec=BaseTool)
-                mock_tool_server1.name = "server1_tool"
-
-                toolkit1 = MagicMock()
-                toolkit1.get_tools.return_value = [mock_tool_server1]
-
-                # Setup second server tools
-                mock_tool_server2 = MagicMock(spec=BaseTool)
-                mock_tool_server2.name = "server2_tool"
-
-                toolkit2 = MagicMock()
-                toolkit2.get_tools.return_value = [mock_tool_server2]
-
-                # Control which toolkit is returned based on server
-                def toolkit_side_effect(*args: Any, **kwargs: Any) -> MagicMock:
-                    session = kwargs.get("session")
-                    # Alternate between toolkits based on call order
-                    if len(adapter.toolkits) == 0:
-                        return toolkit1
-                    return toolkit2
-
-                mock_toolkit_class.side_effect = toolkit_side_effect
-
-                # Connect to both servers
-                await adapter.connect_server("server1", "cmd1")
-                await adapter.connect_server("server2", "cmd2")
-
-                # Get tools from specific servers
-                tools1 = await adapter.get_tools("server1")
-                tools2 = await adapter.get_tools("server2")
-
-                # Verify isolation
-                assert len(tools1) == 1
-                assert len(tools2) == 1
-                assert tools1[0].name == "server1_tool"
-                assert tools2[0].name == "server2_tool"
-
-                # Cleanup
-                await adapter.close_all()
+    # Setup first server tools
+    toolkit1 = _StubToolkit([SimpleNamespace(name="server1_tool")])
+
+    # Setup second server tools
+    toolkit2 = _StubToolkit([SimpleNamespace(name="server2_tool")])
+
+    # Servers are connected in order, so hand out toolkits in the same order
+    toolkits = iter([toolkit1, toolkit2])
+    monkeypatch.setattr("app.services.mcp_adapter.MCPToolkit", lambda session: next(toolkits))
+
+    # Connect to both servers
+    await adapter.connect_server("server1", "cmd1")
+    await adapter.connect_server("server2", "cmd2")
+
+    # Get tools from specific servers
+    tools1 = await adapter.get_tools("server1")
+    tools2 = await adapter.get_tools("server2")
+
+    # Verify isolation
+    assert len(tools1) == 1
+    assert len(tools2) == 1
+    assert tools1[0].name == "server1_tool"
+    assert tools2[0].name == "server2_tool"
+
+    # Cleanup
+    await adapter.close_all()
@@ -7,49 +7,117 @@ subsequent requests use the correct model with proper configurations.
 Validates Requirement 20.4: Model switching logic
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import dataclass
 
 import pytest
-from hypothesis import given, settings
+import pytest_asyncio
+from hypothesis import HealthCheck, given, settings
 from hypothesis import strategies as st
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from app.models.config import ModelConfig
 from app.services.model_config_manager import ModelConfigManager
 
+# Run every test and async fixture on one session-wide loop, so the
+# session-scoped engine stays usable across tests
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture
-async def db_session() -> AsyncSession:
-    """Create async database session for testing."""
-    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-    from sqlalchemy.orm import sessionmaker
 
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+# Strategies built once at import rather than inside each @given
+_MODEL_NAME_CHARS = st.characters(
+    whitelist_categories=("Lu", "Ll", "Nd"), whitelist_characters="-_."
+)
+_MODEL_NAME = st.text(min_size=3, max_size=30, alphabet=_MODEL_NAME_CHARS)
+
+
+@dataclass(frozen=True, slots=True)
+class _StubModel:
+    """Stand-in for a chat model; the tests only read its model name."""
+
+    model_name: str
+
+
+class _FakeChatAnthropic:
+    """ChatAnthropic stand-in that records the keyword arguments it was built with."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
 
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-    async with async_session() as session:
-        # Create tables
-        from app.db.base import Base
+async def _create_stub_model(config: ModelConfig) -> _StubModel:
+    """Replacement for ModelConfigManager._create_model_instance."""
+    return _StubModel(config.model_name)
 
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
 
-        yield session
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_engine(create_schema):
+    """Create the test database engine and schema once per session."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool, echo=False)
+
+    async with engine.begin() as conn:
+        await create_schema(conn)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_session(shared_engine) -> AsyncSession:
+    """Create a test session rolled back after each test."""
+    async with shared_engine.connect() as conn:
+        trans = await conn.begin()
+
+        # Commits stay inside the outer transaction without a SAVEPOINT, so
+        # the session never awaits while provisioning its connection; that
+        # keeps gathered switch_model calls in the concurrency test working
+        session_factory = async_sessionmaker(
+            bind=conn, expire_on_commit=False, join_transaction_mode="rollback_only"
+        )
+        async with session_factory() as session:
+            yield session
+
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def template_config(db_session: AsyncSession) -> ModelConfig:
+    """Persist one model configuration for property examples to update in place."""
+    config = ModelConfig(
+        provider="anthropic",
+        label="Test anthropic model",
+        model_name="template-model",
+        is_default=True,
+        capabilities={
+            "streaming": True,
+            "vision": False,
+            "toolUse": True,
+            "multilingual": True,
+        },
+    )
+    db_session.add(config)
+    await db_session.commit()
+    return config
 
 
-@pytest.mark.asyncio
 @given(
     provider=st.sampled_from(["anthropic", "openai", "local"]),
-    model_name=st.text(
-        min_size=3,
-        max_size=30,
-        alphabet=st.characters(whitelist_categories=("Lu", "Ll", "Nd"), whitelist_characters="-_."),
-    ),
+    model_name=_MODEL_NAME,
+)
+@settings(
+    max_examples=min(30, settings.default.max_examples),
+    deadline=5000,
+    # Examples share the session and one config row, updated in place per example
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
 )
-@settings(max_examples=30, deadline=5000)
 async def test_model_switch_updates_current_model(
-    db_session: AsyncSession, provider: str, model_name: str
+    db_session: AsyncSession,
+    template_config: ModelConfig,
+    monkeypatch: pytest.MonkeyPatch,
+    provider: str,
+    model_name: str,
 ) -> None:
     """
     Property Test: Switching models updates the current model instance.
@@ -59,46 +127,37 @@ async def test_model_switch_updates_current_model(
 
     Args:
         db_session: Database session
+        template_config: Persisted configuration reused by every example
+        monkeypatch: Pytest monkeypatch fixture
         provider: Model provider
         model_name: Model name
     """
     manager = ModelConfigManager(db_session)
 
-    # Create a model configuration
-    config = ModelConfig(
-        provider=provider,
-        label=f"Test {provider} model",
-        model_name=model_name,
-        is_default=True,
-        capabilities={
-            "streaming": True,
-            "vision": False,
-            "toolUse": True,
-            "multilingual": True,
-        },
+    # Point the shared configuration at this example's model
+    await db_session.execute(
+        update(ModelConfig)
+        .where(ModelConfig.id == template_config.id)
+        .values(provider=provider, label=f"Test {provider} model", model_name=model_name)
     )
-
-    db_session.add(config)
-    await db_session.commit()
-    await db_session.refresh(config)
+    config = template_config
 
     # Mock the model creation to avoid actual API calls
-    with patch.object(manager, "_create_model_instance") as mock_create:
-        mock_model = MagicMock()
-        mock_model.model_name = model_name
-        mock_create.return_value = mock_model
+    monkeypatch.setattr(manager, "_create_model_instance", _create_stub_model)
 
-        # Switch to the model
-        result = await manager.switch_model(config_id=config.id)
+    # Switch to the model
+    result = await manager.switch_model(config_id=config.id)
 
-        # Verify current model was updated
-        assert manager.current_model is not None
-        assert manager.current_model.model_name == model_name
-        assert manager.current_config == config
+    # Verify current model was updated
+    assert manager.current_model is not None
+    assert manager.current_model.model_name == model_name
+    assert manager.current_config == config
+    assert manager.current_config.model_name == model_name
 
 
-@pytest.mark.asyncio
-async def test_multiple_model_switches_consistency(db_session: AsyncSession) -> None:
+async def test_multiple_model_switches_consistency(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """
     Integration Test: Multiple model switches maintain consistency.
 
@@ -108,43 +167,36 @@ async def test_multiple_model_switches_consistency(db_session: AsyncSession) ->
     manager = ModelConfigManager(db_session)
 
     # Create multiple configurations
-    configs = []
-    for i, provider in enumerate(["anthropic", "openai", "local"]):
-        config = ModelConfig(
+    configs = [
+        ModelConfig(
             provider=provider,
             label=f"Model {i}",
             model_name=f"model-{i}",
             is_default=(i == 0),
             capabilities={"streaming": True},
         )
-        db_session.add(config)
-        configs.append(config)
-
+        for i, provider in enumerate(["anthropic", "openai", "local"])
+    ]
+    db_session.add_all(configs)
     await db_session.commit()
 
     # Mock model creation
-    with patch.object(manager, "_create_model_instance") as mock_create:
-
-        def create_mock_model(config: ModelConfig) -> MagicMock:
-            mock = MagicMock()
-            mock.model_name = config.model_name
-            return mock
+    monkeypatch.setattr(manager, "_create_model_instance", _create_stub_model)
 
-        mock_create.side_effect = create_mock_model
+    # Switch between models multiple times
+    for _ in range(3):
+        for config in configs:
+            await manager.switch_model(config_id=config.id)
 
-        # Switch between models multiple times
-        for _ in range(3):
-            for config in configs:
-                await manager.switch_model(config_id=config.id)
+            # Verify current model is correct
+            assert manager.current_model is not None
+            assert manager.current_model.model_name == config.model_name
+            assert manager.current_config.id == config.id
 
-                # Verify current model is correct
-                assert manager.current_model is not None
-                assert manager.current_model.model_name == config.model_name
-                assert manager.current_config.id == config.id
 
-
-@pytest.mark.asyncio
-async def test_model_switch_applies_correct_parameters(db_session: AsyncSession) -> None:
+async def test_model_switch_applies_correct_parameters(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """
     Integration Test: Model switching applies correct parameters.
 
@@ -165,26 +217,24 @@ async def test_model_switch_applies_correct_parameters(db_session: AsyncSession)
 
     db_session.add(config)
     await db_session.commit()
-    await db_session.refresh(config)
 
     # Mock ChatAnthropic to capture initialization parameters
-    with patch("app.services.model_config_manager.ChatAnthropic") as mock_chat:
-        mock_instance = MagicMock()
-        mock_chat.return_value = mock_instance
+    monkeypatch.setattr("app.services.model_config_manager.ChatAnthropic", _FakeChatAnthropic)
 
-        await manager.switch_model(config_id=config.id)
+    model = await manager.switch_model(config_id=config.id)
 
-        # Verify ChatAnthropic was called with correct parameters
-        mock_chat.assert_called_once()
-        call_kwargs = mock_chat.call_args.kwargs
+    # Verify ChatAnthropic was called with correct parameters
+    assert isinstance(model, _FakeChatAnthropic)
+    call_kwargs = model.kwargs
 
-        assert call_kwargs["model"] == "claude-3-sonnet-20240229"
-        assert call_kwargs["base_url"] == "https://custom-api.example.com"
-        assert call_kwargs["streaming"] is True
+    assert call_kwargs["model"] == "claude-3-sonnet-20240229"
+    assert call_kwargs["base_url"] == "https://custom-api.example.com"
+    assert call_kwargs["streaming"] is True
 
 
-@pytest.mark.asyncio
-async def test_model_switch_by_label(db_session: AsyncSession) -> None:
+async def test_model_switch_by_label(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """
     Integration Test: Can switch models by label.
 
@@ -203,21 +253,19 @@ async def test_model_switch_by_label(db_session: AsyncSession) -> None:
 
     db_session.add(config)
     await db_session.commit()
-    await db_session.refresh(config)
 
-    with patch.object(manager, "_create_model_instance") as mock_create:
-        mock_model = MagicMock()
-        mock_create.return_value = mock_model
+    monkeypatch.setattr(manager, "_create_model_instance", _create_stub_model)
 
-        # Switch by label
-        await manager.switch_model(label=label)
+    # Switch by label
+    await manager.switch_model(label=label)
 
-        # Verify correct model was loaded
-        assert manager.current_config.label == label
+    # Verify correct model was loaded
+    assert manager.current_config.label == label
 
 
-@pytest.mark.asyncio
-async def test_model_switch_to_default_when_no_params(db_session: AsyncSession) -> None:
+async def test_model_switch_to_default_when_no_params(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """
     Integration Test: Switches to default model when no parameters provided.
 
@@ -245,19 +293,16 @@ async def test_model_switch_to_default_when_no_params(db_session: AsyncSession)
     db_session.add_all([config1, config2])
     await db_session.commit()
 
-    with patch.object(manager, "_create_model_instance") as mock_create:
-        mock_model = MagicMock()
-        mock_create.return_value = mock_model
+    monkeypatch.setattr(manager, "_create_model_instance", _create_stub_model)
 
-        # Switch without parameters
-        await manager.switch_model()
+    # Switch without parameters
+    await manager.switch_model()
 
-        # Verify default model was loaded
-        assert manager.current_config.is_default is True
-        assert manager.current_config.label == "Default"
+    # Verify default model was loaded
+    assert manager.current_config.is_default is True
+    assert manager.current_config.label == "Default"
 
 
-@pytest.mark.asyncio
 async def test_model_switch_nonexistent_model_fails(db_session: AsyncSession) -> None:
     """
     Integration Test: Switching to nonexistent model fails gracefully.
@@ -273,15 +318,24 @@ async def test_model_switch_nonexistent_model_fails(db_session: AsyncSession) ->
         await manager.switch_model(config_id=99999)
 
 
-@pytest.mark.asyncio
 @given(
     streaming=st.booleans(),
     vision=st.booleans(),
     tool_use=st.booleans(),
 )
-@settings(max_examples=20, deadline=5000)
+@settings(
+    max_examples=min(20, settings.default.max_examples),
+    deadline=5000,
+    # Examples share one session and only look configs up by ID, so rows left by
+    # earlier examples don't affect later ones; the test's transaction is rolled back
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
 async def test_model_capabilities_preserved_after_switch(
-    db_session: AsyncSession, streaming: bool, vision: bool, tool_use: bool
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    streaming: bool,
+    vision: bool,
+    tool_use: bool,
 ) -> None:
     """
     Property Test: Model capabilities are preserved after switching.
@@ -291,6 +345,7 @@ async def test_model_capabilities_preserved_after_switch(
 
     Args:
         db_session: Database session
+        monkeypatch: Pytest monkeypatch fixture
         streaming: Streaming capability
         vision: Vision capability
         tool_use: Tool use capability
@@ -314,21 +369,19 @@ async def test_model_capabilities_preserved_after_switch(
 
     db_session.add(config)
     await db_session.commit()
-    await db_session.refresh(config)
 
-    with patch("app.services.model_config_manager.ChatAnthropic") as mock_chat:
-        mock_instance = MagicMock()
-        mock_chat.return_value = mock_instance
+    monkeypatch.setattr("app.services.model_config_manager.ChatAnthropic", _FakeChatAnthropic)
 
-        await manager.switch_model(config_id=config.id)
+    model = await manager.switch_model(config_id=config.id)
 
-        # Verify streaming capability was applied
-        call_kwargs = mock_chat.call_args.kwargs
-        assert call_kwargs["streaming"] == streaming
+    # Verify streaming capability was applied
+    call_kwargs = model.kwargs
+    assert call_kwargs["streaming"] == streaming
 
 
-@pytest.mark.asyncio
-async def test_concurrent_model_switches(db_session: AsyncSession) -> None:
+async def test_concurrent_model_switches(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """
     Integration Test: Concurrent model switches are handled correctly.
 
@@ -340,34 +393,32 @@ async def test_concurrent_model_switches(db_session: AsyncSession) -> None:
     manager = ModelConfigManager(db_session)
 
     # Create multiple configurations
-    configs = []
-    for i in range(5):
-        config = ModelConfig(
+    configs = [
+        ModelConfig(
             provider="anthropic",
             label=f"Model {i}",
             model_name=f"claude-{i}",
             is_default=(i == 0),
         )
-        db_session.add(config)
-        configs.append(config)
-
+        for i in range(5)
+    ]
+    db_session.add_all(configs)
     await db_session.commit()
 
-    with patch.object(manager, "_create_model_instance") as mock_create:
+    # Every switch to a config gets the same stub back
+    stubs = {config.model_name: _StubModel(config.model_name) for config in configs}
 
-        def create_mock(config: ModelConfig) -> MagicMock:
-            mock = MagicMock()
-            mock.model_name = config.model_name
-            return mock
+    async def _get_stub_model(config: ModelConfig) -> _StubModel:
+        return stubs[config.model_name]
 
-        mock_create.side_effect = create_mock
+    monkeypatch.setattr(manager, "_create_model_instance", _get_stub_model)
 
-        # Trigger multiple switches concurrently
-        tasks = [manager.switch_model(config_id=config.id) for config in configs]
-        await asyncio.gather(*tasks)
+    # Trigger multiple switches concurrently
+    tasks = [manager.switch_model(config_id=config.id) for config in configs]
+    await asyncio.gather(*tasks)
 
-        # Verify final state is one of the configs
-        assert manager.current_model is not None
-        assert any(
-            manager.current_model.model_name == config.model_name for config in configs
-        )
+    # Verify final state is one of the configs
+    assert manager.current_model is not None
+    assert any(
+        manager.current_model.model_name == config.model_name for config in configs
+    )
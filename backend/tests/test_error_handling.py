@@ -205,10 +205,16 @@ class TestRetryAsync:
                 raise NetworkError("Connection failed")
             return "success"
 
-        result = await retry_async(retry_func, max_retries=3)
+        delays = []
+
+        async def record_sleep(delay):
+            delays.append(delay)
+
+        result = await retry_async(retry_func, max_retries=3, sleep=record_sleep)
 
         assert result == "success"
         assert call_count == 3
+        assert len(delays) == 2  # Waited before each retry, without real sleeps
 
     @pytest.mark.asyncio
     async def test_retry_async_all_fail(self):
@@ -220,8 +226,11 @@ class TestRetryAsync:
             call_count += 1
             raise NetworkError("Connection failed")
 
+        async def no_sleep(delay):
+            pass
+
         with pytest.raises(NetworkError):
-            await retry_async(fail_func, max_retries=2)
+            await retry_async(fail_func, max_retries=2, sleep=no_sleep)
 
         assert call_count == 3  # Initial + 2 retries
 
@@ -245,7 +254,8 @@ class TestRetryAsync:
         """Test retry decorator."""
         call_count = 0
 
-        @retry(max_retries=2)
+        # Zero backoff so the retry doesn't wait in real time
+        @retry(max_retries=2, strategy=RetryStrategy(initial_delay=0.0, jitter=False))
         async def decorated_func():
             nonlocal call_count
             call_count += 1
@@ -295,7 +305,10 @@ class TestCircuitBreaker:
 
     def test_circuit_breaker_half_open(self):
         """Test circuit breaker half-open state."""
-        cb = CircuitBreaker(failure_threshold=2, recovery_timeout=0.1)
+        now = [0.0]
+        cb = CircuitBreaker(
+            failure_threshold=2, recovery_timeout=0.1, clock=lambda: now[0]
+        )
 
         def fail_func():
             raise Exception("Error")
@@ -309,9 +322,8 @@ class TestCircuitBreaker:
 
         assert cb.state == "open"
 
-        # Wait for recovery timeout
-        import time
-        time.sleep(0.2)
+        # Advance the clock past the recovery timeout
+        now[0] += 0.2
 
         # Should be half-open now
         def success_func():
@@ -7,9 +7,8 @@ This module tests the prompt suggestion and inspiration board functionality.
 import uuid
 from datetime import datetime
 
-import pytest
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, String, Text, create_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, String, Text
+from sqlalchemy.orm import Session, declarative_base
 
 # Create a test base compatible with SQLite
 TestBase = declarative_base()
@@ -52,30 +51,6 @@ class TestInspirationBoard(TestBase):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
-# Fixtures
-@pytest.fixture(scope="module")
-def test_engine():
-    """Create test database engine."""
-    engine = create_engine("sqlite:///:memory:")
-    TestBase.metadata.create_all(bind=engine)
-    yield engine
-    engine.dispose()
-
-
-@pytest.fixture(scope="function")
-def test_session(test_engine) -> Session:
-    """Create a new database session for a test."""
-    TestingSessionLocal = sessionmaker(
-        autocommit=False,
-        autoflush=False,
-        bind=test_engine,
-    )
-    session = TestingSessionLocal()
-    yield session
-    session.rollback()
-    session.close()
-
-
 class TestPromptSuggestionModel:
     """Test suite for PromptSuggestion model."""
 
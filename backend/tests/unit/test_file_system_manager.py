@@ -4,19 +4,21 @@ import tempfile
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.core.exceptions import FileNotFoundError, PermissionDeniedError
-from app.db.base import Base
 from app.services.file_system_manager import FileSystemManager
 
 
 @pytest.fixture
-async def test_db():
+async def test_db(create_schema):
     """Create a test database."""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:", poolclass=StaticPool, echo=False
+    )
 
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await create_schema(conn)
 
     async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
@@ -5,7 +5,6 @@ Tests skill package loading, validation, activation, and management.
 Validates Requirements 6.1-6.5, 12.1-12.5
 """
 
-import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -16,11 +15,9 @@ from app.services.skill_loader import SkillLoader
 
 
 @pytest.fixture
-def skill_loader() -> SkillLoader:
+def skill_loader(skills_dir: Path) -> SkillLoader:
     """Create skill loader instance for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        loader = SkillLoader(skills_directory=temp_dir, sandbox_enabled=True)
-        yield loader
+    return SkillLoader(skills_directory=str(skills_dir), sandbox_enabled=True)
 
 
 @pytest.fixture
@@ -271,6 +268,34 @@ class TestSkillActivationDeactivation:
 
         assert skill_loader.active_skills[skill_name]["active"] is False
 
+    @pytest.mark.asyncio
+    async def test_activate_skills(self, skill_loader: SkillLoader, test_skill_dir: Path) -> None:
+        """Test activating several skills at once."""
+        import shutil
+
+        skill_names = ["test_skill", "other_skill"]
+        for skill_name in skill_names:
+            shutil.copytree(test_skill_dir, Path(skill_loader.skills_directory) / skill_name)
+
+        await skill_loader.activate_skills(skill_names)
+
+        for skill_name in skill_names:
+            assert skill_loader.active_skills[skill_name]["active"] is True
+
+    @pytest.mark.asyncio
+    async def test_activate_skills_missing_skill_activates_none(
+        self, skill_loader: SkillLoader, test_skill_dir: Path
+    ) -> None:
+        """Test a missing skill leaves the others inactive."""
+        import shutil
+
+        shutil.copytree(test_skill_dir, Path(skill_loader.skills_directory) / "test_skill")
+
+        with pytest.raises(SkillLoadError, match="not found"):
+            await skill_loader.activate_skills(["test_skill", "nonexistent_skill"])
+
+        assert skill_loader.active_skills == {}
+
     @pytest.mark.asyncio
     async def test_deactivate_not_loaded_skill(self, skill_loader: SkillLoader) -> None:
         """Test deactivating not loaded skill fails."""
@@ -343,6 +368,24 @@ Instructions for skill {i}.
             assert f"skill{i}" in instructions.lower()
             assert f"Instructions for skill {i}" in instructions
 
+    @pytest.mark.asyncio
+    async def test_get_active_instructions_refreshed_after_deactivation(
+        self, skill_loader: SkillLoader, test_skill_dir: Path
+    ) -> None:
+        """Test cached instructions are rebuilt when activation changes."""
+        import shutil
+
+        skill_name = test_skill_dir.name
+        shutil.copytree(test_skill_dir, Path(skill_loader.skills_directory) / skill_name)
+        await skill_loader.activate_skill(skill_name)
+
+        instructions = skill_loader.get_active_instructions()
+        assert skill_loader.get_active_instructions() is instructions
+
+        await skill_loader.deactivate_skill(skill_name)
+
+        assert skill_loader.get_active_instructions() == ""
+
     def test_get_active_skills_list(self, skill_loader: SkillLoader) -> None:
         """Test getting list of active skills."""
         # Manually add some active skills for testing
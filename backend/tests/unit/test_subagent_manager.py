@@ -1,9 +1,11 @@
 """Unit tests for SubAgentManager."""
+import asyncio
+
 import pytest
 from langchain_core.messages import AIMessage, HumanMessage
 from unittest.mock import AsyncMock
 
-from app.services.subagent_manager import AgentType, SubAgentManager
+from app.services.subagent_manager import MAX_FILTER_SUMMARY_CHARS, AgentType, SubAgentManager
 
 
 @pytest.fixture
@@ -99,3 +101,99 @@ async def test_different_agent_types(subagent_manager: SubAgentManager):
 
         agent = subagent_manager.agents[agent_id]
         assert agent.agent_type == agent_type
+
+
+@pytest.mark.asyncio
+async def test_coordinate_agents_stream(subagent_manager: SubAgentManager):
+    """Test streaming agent results in completion order."""
+    agent1_id = await subagent_manager.spawn_agent(
+        agent_type=AgentType.RESEARCH,
+        task_description="Research topic A",
+    )
+    agent2_id = await subagent_manager.spawn_agent(
+        agent_type=AgentType.EDITING,
+        task_description="Edit document B",
+    )
+
+    results = {
+        agent_id: result
+        async for agent_id, result in subagent_manager.coordinate_agents_stream(
+            [agent1_id, agent2_id, "missing-agent"]
+        )
+    }
+
+    assert results == {agent1_id: "Mocked response", agent2_id: "Mocked response"}
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_are_coalesced():
+    """Test that identical in-flight agent requests share one LLM call."""
+
+    async def slow_response(messages):
+        await asyncio.sleep(0.01)
+        return AIMessage(content="Shared response")
+
+    llm = AsyncMock()
+    llm.ainvoke.side_effect = slow_response
+    manager = SubAgentManager(llm=llm)
+
+    agent_ids = [
+        await manager.spawn_agent(
+            agent_type=AgentType.RESEARCH,
+            task_description="Research topic A",
+        )
+        for _ in range(3)
+    ]
+
+    results = await manager.coordinate_agents(agent_ids)
+
+    assert llm.ainvoke.await_count == 1
+    assert set(results.values()) == {"Shared response"}
+    assert all(manager.agents[agent_id].result == "Shared response" for agent_id in agent_ids)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_owner_does_not_fail_coalesced_waiters():
+    """Test that waiters make the call themselves when the shared call's owner is cancelled."""
+
+    async def slow_response(messages):
+        await asyncio.sleep(0.01)
+        return AIMessage(content="Own response")
+
+    llm = AsyncMock()
+    llm.ainvoke.side_effect = slow_response
+    manager = SubAgentManager(llm=llm)
+
+    owner_id, waiter_id = [
+        await manager.spawn_agent(
+            agent_type=AgentType.RESEARCH,
+            task_description="Research topic A",
+        )
+        for _ in range(2)
+    ]
+
+    owner = asyncio.create_task(manager._execute_coalesced(manager.agents[owner_id]))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(manager.coordinate_agents([waiter_id]))
+    await asyncio.sleep(0)
+    owner.cancel()
+
+    assert await waiter == {waiter_id: "Own response"}
+    assert owner.cancelled()
+    assert llm.ainvoke.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_filter_context_summary_stays_within_budget(
+    subagent_manager: SubAgentManager, mock_llm
+):
+    """Test that the context-filter prompt stops adding previews past its character budget."""
+    context = [HumanMessage(content=f"Message {i} " + "x" * 300) for i in range(100)]
+
+    await subagent_manager._filter_context(context, "Summarize", max_size=1000)
+
+    summary = mock_llm.ainvoke.await_args.args[0][1].content
+    assert summary.startswith("Messages:\n\n")
+    assert len(summary) - len("Messages:\n\n") <= MAX_FILTER_SUMMARY_CHARS
+    assert "[0] Message 0" in summary
+    assert "[99]" not in summary
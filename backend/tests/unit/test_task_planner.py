@@ -3,19 +3,21 @@ import pytest
 from langchain_core.messages import AIMessage
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from unittest.mock import AsyncMock
 
-from app.db.base import Base
 from app.services.task_planner import TaskPlanner
 
 
 @pytest.fixture
-async def test_db():
+async def test_db(create_test_schema):
     """Create a test database."""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:", poolclass=StaticPool, echo=False
+    )
 
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await create_test_schema(conn)
 
     async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
@@ -128,3 +130,48 @@ async def test_update_plan(task_planner: TaskPlanner):
     )
 
     assert updated_plan.status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_plan_readable_after_commit(test_db, mock_llm):
+    """Test that returned plans stay readable on an expire_on_commit session."""
+    async with AsyncSession(test_db.bind, expire_on_commit=True) as session:
+        planner = TaskPlanner(session=session, llm=mock_llm)
+
+        plan = await planner.create_todos(
+            workspace_id="test-workspace",
+            goal="Write a newsletter",
+        )
+        assert plan.goal == "Write a newsletter"
+
+        updated_plan = await planner.update_plan(plan.id, {"status": "completed"})
+        assert updated_plan.status == "completed"
+        assert updated_plan.updated_at is not None
+
+
+@pytest.mark.asyncio
+async def test_analyze_goal_reuses_cached_plan(mock_llm):
+    """Test that a recurring goal is served from the plan cache."""
+    planner = TaskPlanner(session=AsyncMock(), llm=mock_llm)
+
+    first = await planner.analyze_goal("Write a blog post about AI")
+    second = await planner.analyze_goal("Write a blog post about AI")
+    await planner.analyze_goal("Write a blog post about AI", context="For beginners")
+
+    assert second == first
+    assert mock_llm.ainvoke.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_analyze_goal_cache_hits_are_isolated(mock_llm):
+    """Test that changing a returned analysis does not alter later cache hits."""
+    planner = TaskPlanner(session=AsyncMock(), llm=mock_llm)
+
+    first = await planner.analyze_goal("Write a blog post about AI")
+    first["tasks"].clear()
+    second = await planner.analyze_goal("Write a blog post about AI")
+    second["tasks"][0]["title"] = "Changed"
+    third = await planner.analyze_goal("Write a blog post about AI")
+
+    assert len(third["tasks"]) == 3
+    assert third["tasks"][0]["title"] == "Research topic"